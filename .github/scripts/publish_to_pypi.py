@@ -9,25 +9,40 @@ Usage:
 """
 
 import argparse
+import os
+import runpy
+import shutil
 import subprocess
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 
+# Top-level build output directories; *.egg-info is matched by suffix
+BUILD_ARTIFACT_DIRS = frozenset({"dist", "build"})
 
-def run_command(cmd: str, description: str) -> subprocess.CompletedProcess | None:
-    """Run a command and handle errors."""
+# (module, argv, description) for each quality gate, run in-process
+QUALITY_CHECKS: tuple[tuple[str, list[str], str], ...] = (
+    ("black", ["--check", "."], "Black formatting check"),
+    ("isort", ["--check-only", "."], "Import sorting check"),
+    ("flake8", ["."], "Flake8 linting"),
+)
+
+
+def run_command(cmd: list[str], description: str) -> subprocess.CompletedProcess | None:
+    """Run a command (as an argv list, without a shell) and handle errors.
+
+    Output is streamed straight to the console rather than captured, so
+    long builds and uploads show progress and the tool's own diagnostics
+    are already visible if it fails.
+    """
     print(f"🔧 {description}...")
     try:
-        result = subprocess.run(
-            cmd, shell=True, check=True, capture_output=True, text=True
-        )
+        result = subprocess.run(cmd, check=True)
         print(f"✅ {description} completed successfully")
         return result
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed:")
         print(f"Exit code: {e.returncode}")
-        print(f"stdout: {e.stdout}")
-        print(f"stderr: {e.stderr}")
         sys.exit(1)
 
 
@@ -38,73 +53,111 @@ def check_dependencies() -> None:
     required_tools = ["twine", "build"]
     missing_tools = []
 
+    # Both tools are invoked as "python -m <tool>", so an import-machinery
+    # lookup is enough; no need to start a subprocess per tool
     for tool in required_tools:
-        try:
-            subprocess.run([tool, "--version"], capture_output=True, check=True)
+        if find_spec(tool) is not None:
             print(f"   ✅ {tool} is installed")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        else:
             missing_tools.append(tool)
             print(f"   ❌ {tool} is not installed")
 
     if missing_tools:
         print(f"\n📦 Installing missing tools: {', '.join(missing_tools)}")
-        install_cmd = f"pip install {' '.join(missing_tools)}"
+        install_cmd = [sys.executable, "-m", "pip", "install", *missing_tools]
         run_command(install_cmd, "Installing build tools")
 
 
+def _remove_artifacts(directory: str, names: frozenset[str]) -> None:
+    """Remove matching build artifacts from a single directory listing."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name not in names and not entry.name.endswith(".egg-info"):
+                continue
+            path = Path(entry.path)
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(path)
+                print(f"   🗑️  Removed directory: {path}")
+            else:
+                path.unlink()
+                print(f"   🗑️  Removed file: {path}")
+
+
 def clean_build_artifacts() -> None:
     """Clean previous build artifacts."""
     print("🧹 Cleaning build artifacts...")
 
-    paths_to_clean = ["dist/", "build/", "src/*.egg-info/", "*.egg-info/"]
+    _remove_artifacts(".", BUILD_ARTIFACT_DIRS)
+    if os.path.isdir("src"):
+        _remove_artifacts("src", frozenset())
 
-    for path_pattern in paths_to_clean:
-        for path in Path(".").glob(path_pattern):
-            if path.exists():
-                if path.is_dir():
-                    import shutil
 
-                    shutil.rmtree(path)
-                    print(f"   🗑️  Removed directory: {path}")
-                else:
-                    path.unlink()
-                    print(f"   🗑️  Removed file: {path}")
+def run_tool_in_process(module: str, args: list[str]) -> int:
+    """Run a tool's ``__main__`` in this interpreter and return its exit code."""
+    saved_argv = sys.argv
+    sys.argv = [module, *args]
+    try:
+        runpy.run_module(module, run_name="__main__", alter_sys=True)
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    finally:
+        sys.argv = saved_argv
+    return 0
 
 
 def run_quality_checks() -> None:
-    """Run code quality checks before building."""
-    print("🔍 Running quality checks...")
+    """Run code quality checks before building.
 
-    # Check if code is formatted
-    run_command("python -m black --check .", "Black formatting check")
+    The tools are executed inside the current interpreter rather than as
+    separate ``python -m`` subprocesses, avoiding an interpreter start-up
+    per check.
+    """
+    print("🔍 Running quality checks...")
 
-    # Check imports
-    run_command("python -m isort --check-only .", "Import sorting check")
+    for module, args, description in QUALITY_CHECKS:
+        print(f"🔧 {description}...")
+        if find_spec(module) is None:
+            print(f"❌ {description} failed: {module} is not installed")
+            sys.exit(1)
 
-    # Run linting
-    run_command("python -m flake8 .", "Flake8 linting")
+        exit_code = run_tool_in_process(module, args)
+        if exit_code != 0:
+            print(f"❌ {description} failed:")
+            print(f"Exit code: {exit_code}")
+            sys.exit(1)
+        print(f"✅ {description} completed successfully")
 
     print("✅ All quality checks passed")
 
 
 def build_package() -> None:
     """Build the package."""
-    run_command("python -m build", "Building package")
+    run_command([sys.executable, "-m", "build"], "Building package")
 
     # List built files
-    dist_files = list(Path("dist").glob("*"))
-    if dist_files:
-        print("📦 Built packages:")
-        for file in sorted(dist_files):
-            print(f"   📄 {file}")
-    else:
+    dist_dir = Path("dist")
+    dist_files = sorted(dist_dir.iterdir()) if dist_dir.is_dir() else []
+    if not dist_files:
         print("❌ No package files found in dist/")
         sys.exit(1)
 
+    print("📦 Built packages:")
+    print("\n".join(f"   📄 {file}" for file in dist_files))
+
+
+def dist_paths() -> list[str]:
+    """Expand dist/* without a shell."""
+    return [str(path) for path in Path("dist").glob("*")]
+
 
 def check_package() -> None:
     """Check the package with twine."""
-    run_command("python -m twine check dist/*", "Checking package with twine")
+    run_command(
+        [sys.executable, "-m", "twine", "check", *dist_paths()],
+        "Checking package with twine",
+    )
 
 
 def upload_to_testpypi() -> None:
@@ -113,7 +166,15 @@ def upload_to_testpypi() -> None:
     print("   You'll need your TestPyPI API token.")
     print("   Create one at: https://test.pypi.org/manage/account/")
 
-    cmd = "python -m twine upload --repository testpypi dist/*"
+    cmd = [
+        sys.executable,
+        "-m",
+        "twine",
+        "upload",
+        "--repository",
+        "testpypi",
+        *dist_paths(),
+    ]
     run_command(cmd, "Uploading to TestPyPI")
 
     print("\n🎉 Upload to TestPyPI successful!")
@@ -135,7 +196,7 @@ def upload_to_pypi() -> None:
         print("❌ Upload cancelled")
         return
 
-    cmd = "python -m twine upload dist/*"
+    cmd = [sys.executable, "-m", "twine", "upload", *dist_paths()]
     run_command(cmd, "Uploading to PyPI")
 
     print("\n🎉 Upload to PyPI successful!")
@@ -15,114 +15,111 @@ Usage:
 """
 
 import argparse
+import os
 import re
+import shutil
 import sys
+import tempfile
+from collections.abc import Callable
 from pathlib import Path
 
+PYPROJECT = Path(__file__).resolve().parents[2] / "pyproject.toml"
+
+_VERSION_RE = re.compile(r'^version = "([^"]+)"', re.MULTILINE)
+_SUFFIX_RE = re.compile(r"(\d+\.\d+\.\d+)(?:(a|b|rc)(\d+))?")
+_PEP440_RE = re.compile(r"^(\d+!)?\d+(\.\d+)*((a|b|rc)\d+)?(\.post\d+)?(\.dev\d+)?$")
+
+_PRE_RELEASE_SUFFIXES = {"alpha": "a", "beta": "b", "rc": "rc"}
+
 
 def get_current_version() -> str:
     """Extract current version from pyproject.toml"""
-    pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
+    content = PYPROJECT.read_text(encoding="utf-8")
 
-    with open(pyproject_path, encoding="utf-8") as f:
-        content = f.read()
-
-    match = re.search(r'^version = "([^"]+)"', content, re.MULTILINE)
+    match = _VERSION_RE.search(content)
     if not match:
         raise ValueError("Could not find version in pyproject.toml")
 
     return match.group(1)
 
 
-def set_version(new_version: str) -> None:
-    """Update version in pyproject.toml"""
-    pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
+def rewrite_version(compute: Callable[[str], str]) -> str:
+    """Replace the version in pyproject.toml in a single streamed pass.
+
+    ``compute`` receives the current version and returns the new one, so
+    callers that derive the new version never need a separate read.
+    """
+    new_version = None
+    old_version = None
+
+    # Stream into a sibling temp file and swap it in atomically, so an
+    # interrupted run can never leave a truncated pyproject.toml behind
+    with (
+        open(PYPROJECT, encoding="utf-8", newline="") as src,
+        tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", newline="", dir=PYPROJECT.parent, delete=False
+        ) as dst,
+    ):
+        try:
+            for line in src:
+                match = _VERSION_RE.match(line) if new_version is None else None
+                if match:
+                    old_version = match.group(1)
+                    new_version = compute(old_version)
+                    ending = line[len(line.rstrip("\r\n")) :]
+                    dst.write(f'version = "{new_version}"{ending}')
+                else:
+                    dst.write(line)
+        except BaseException:
+            dst.close()
+            os.unlink(dst.name)
+            raise
+
+    if new_version is None:
+        os.unlink(dst.name)
+        raise ValueError("Could not find version in pyproject.toml")
 
-    with open(pyproject_path, encoding="utf-8") as f:
-        content = f.read()
+    # Leave the file (and its mtime) alone when the version is unchanged
+    if new_version == old_version:
+        os.unlink(dst.name)
+        return new_version
 
-    # Replace version line
-    new_content = re.sub(
-        r'^version = "[^"]+"', f'version = "{new_version}"', content, flags=re.MULTILINE
-    )
+    shutil.copymode(PYPROJECT, dst.name)
+    os.replace(dst.name, PYPROJECT)
+    return new_version
 
-    with open(pyproject_path, "w", encoding="utf-8") as f:
-        f.write(new_content)
+
+def set_version(new_version: str) -> None:
+    """Update version in pyproject.toml"""
+    rewrite_version(lambda _current: new_version)
 
     print(f"✅ Updated version to: {new_version}")
 
 
-def parse_and_increment_alpha(current: str, base_version: str) -> str:
-    """Handle alpha version incrementing"""
-    if "a" in current:
-        # Increment existing alpha
-        alpha_match = re.search(r"a(\d+)", current)
-        if alpha_match:
-            alpha_num = int(alpha_match.group(1)) + 1
-            return f"{base_version}a{alpha_num}"
-        else:
-            return f"{base_version}a1"
-    else:
-        # Start new alpha series
-        return f"{base_version}a1"
-
-
-def parse_and_increment_beta(current: str, base_version: str) -> str:
-    """Handle beta version incrementing"""
-    if "b" in current:
-        # Increment existing beta
-        beta_match = re.search(r"b(\d+)", current)
-        if beta_match:
-            beta_num = int(beta_match.group(1)) + 1
-            return f"{base_version}b{beta_num}"
-        else:
-            return f"{base_version}b1"
-    else:
-        # Start new beta series
-        return f"{base_version}b1"
-
-
-def parse_and_increment_rc(current: str, base_version: str) -> str:
-    """Handle release candidate version incrementing"""
-    if "rc" in current:
-        # Increment existing rc
-        rc_match = re.search(r"rc(\d+)", current)
-        if rc_match:
-            rc_num = int(rc_match.group(1)) + 1
-            return f"{base_version}rc{rc_num}"
-        else:
-            return f"{base_version}rc1"
-    else:
-        # Start new rc series
-        return f"{base_version}rc1"
-
-
-def increment_version(version_type: str) -> str:
+def increment_version(version_type: str, current: str | None = None) -> str:
     """Auto-increment version based on current version"""
-    current = get_current_version()
+    if current is None:
+        current = get_current_version()
+
+    suffix = _PRE_RELEASE_SUFFIXES.get(version_type)
+    if suffix is None:
+        raise ValueError(f"Unknown version type: {version_type}")
 
-    # Parse current version
-    base_match = re.match(r"(\d+\.\d+\.\d+)", current)
-    if not base_match:
+    # One match yields the base version and any existing pre-release segment
+    match = _SUFFIX_RE.match(current)
+    if not match:
         raise ValueError(f"Could not parse base version from: {current}")
 
-    base_version = base_match.group(1)
+    base_version, kind, number = match.groups()
 
-    # Increment logic
-    if version_type == "alpha":
-        return parse_and_increment_alpha(current, base_version)
-    elif version_type == "beta":
-        return parse_and_increment_beta(current, base_version)
-    elif version_type == "rc":
-        return parse_and_increment_rc(current, base_version)
-    else:
-        raise ValueError(f"Unknown version type: {version_type}")
+    # Increment within the same series, otherwise start a new one
+    next_number = int(number) + 1 if kind == suffix else 1
+    return f"{base_version}{suffix}{next_number}"
 
 
 def validate_version(version: str) -> bool:
     """Validate PEP 440 compliance"""
-    pep440_pattern = r"^(\d+!)?\d+(\.\d+)*((a|b|rc)\d+)?(\.post\d+)?(\.dev\d+)?$"
-    if not re.match(pep440_pattern, version):
+    if not _PEP440_RE.match(version):
         raise ValueError(f"Version '{version}' is not PEP 440 compliant")
     return True
 
@@ -151,9 +148,15 @@ def main() -> None:
             print(f"Current version: {current}")
 
         elif args.increment:
-            new_version = increment_version(args.increment)
-            validate_version(new_version)
-            set_version(new_version)
+
+            def next_version(current: str) -> str:
+                new_version = increment_version(args.increment, current)
+                validate_version(new_version)
+                return new_version
+
+            # Read, increment and write back in one pass over pyproject.toml
+            new_version = rewrite_version(next_version)
+            print(f"✅ Updated version to: {new_version}")
 
         elif args.version:
             validate_version(args.version)
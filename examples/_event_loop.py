@@ -0,0 +1,37 @@
+"""
+Event loop selection shared by the async example scripts.
+
+uvloop is an optional drop-in event loop that speeds up socket I/O; the
+examples fall back to the stdlib loop where it is unavailable (e.g. Windows).
+"""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def run_example(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run an example's main coroutine, on uvloop when it is installed.
+
+    uvloop.run() only exists from uvloop 0.18; older releases are installed
+    as the event loop policy instead.
+
+    Args:
+        main: Coroutine to run to completion
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    if hasattr(uvloop, "run"):
+        return uvloop.run(main)
+
+    uvloop.install()
+    return asyncio.run(main)
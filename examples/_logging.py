@@ -0,0 +1,34 @@
+"""
+Shared logging setup for the example scripts.
+
+Installs a single stdout handler with a prebuilt formatter on the root logger,
+once per process, so examples imported in sequence don't reconfigure logging.
+"""
+
+import logging
+import sys
+
+_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+_configured = False
+
+
+def setup_example_logging(level: int = logging.INFO) -> None:
+    """
+    Attach the shared stdout handler to the root logger and set its level.
+
+    The handler is only installed on the first call; later calls just adjust
+    the root level.
+
+    Args:
+        level: Logging level for the root logger
+    """
+    global _configured
+
+    root = logging.getLogger()
+    if not _configured:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(_FORMATTER)
+        root.addHandler(handler)
+        _configured = True
+    root.setLevel(level)
@@ -0,0 +1,98 @@
+"""
+Retry helpers shared by the example scripts.
+
+OTP submission is retried with capped exponential backoff and jitter, but only
+on connection errors: a rejected OTP (DysonAuthError) is never retried, and
+repeated OTP requests are spaced out to avoid triggering server-side lockouts.
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from libdyson_rest import DysonConnectionError
+
+T = TypeVar("T")
+
+# Minimum seconds between OTP send requests for the same account
+OTP_SEND_INTERVAL = 30.0
+
+# Account identifier -> monotonic time of its last OTP send request
+_last_otp_send: dict[str, float] = {}
+
+
+def _backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Return the sleep before retry number ``attempt`` (0-based)."""
+    return min(cap, base * 2**attempt) + random.uniform(0, base)
+
+
+def retry_with_backoff(
+    fn: Callable[[], T], attempts: int = 5, base: float = 1.0, cap: float = 30.0
+) -> T:
+    """
+    Call ``fn``, retrying connection errors with exponential backoff and jitter.
+
+    Args:
+        fn: Zero-argument callable to invoke
+        attempts: Maximum number of calls
+        base: Initial delay in seconds, also the jitter range
+        cap: Upper bound on the exponential part of the delay
+
+    Returns:
+        Whatever ``fn`` returns
+
+    Raises:
+        DysonConnectionError: If every attempt fails to connect
+    """
+    for attempt in range(attempts - 1):
+        try:
+            return fn()
+        except DysonConnectionError:
+            time.sleep(_backoff_delay(attempt, base, cap))
+    return fn()
+
+
+async def async_retry_with_backoff(
+    fn: Callable[[], Awaitable[T]],
+    attempts: int = 5,
+    base: float = 1.0,
+    cap: float = 30.0,
+) -> T:
+    """
+    Await ``fn()``, retrying connection errors with exponential backoff and jitter.
+
+    Args:
+        fn: Zero-argument callable returning an awaitable
+        attempts: Maximum number of calls
+        base: Initial delay in seconds, also the jitter range
+        cap: Upper bound on the exponential part of the delay
+
+    Returns:
+        Whatever the awaitable resolves to
+
+    Raises:
+        DysonConnectionError: If every attempt fails to connect
+    """
+    for attempt in range(attempts - 1):
+        try:
+            return await fn()
+        except DysonConnectionError:
+            await asyncio.sleep(_backoff_delay(attempt, base, cap))
+    return await fn()
+
+
+def wait_for_otp_send_slot(account: str) -> None:
+    """
+    Block until an OTP may be requested again for ``account``, then claim it.
+
+    Args:
+        account: Email address or mobile number the OTP is sent to
+    """
+    last = _last_otp_send.get(account)
+    if last is not None:
+        remaining = OTP_SEND_INTERVAL - (time.monotonic() - last)
+        if remaining > 0:
+            time.sleep(remaining)
+    _last_otp_send[account] = time.monotonic()
@@ -6,141 +6,197 @@ This script extracts and displays all MQTT-related information available
 from the Dyson API without creating actual MQTT connections.
 """
 
-import json
+from __future__ import annotations
+
 import logging
-from getpass import getpass
-from typing import Any
-
-from libdyson_rest import (
-    DysonAPIError,
-    DysonAuthError,
-    DysonClient,
-    DysonConnectionError,
-)
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+# libdyson_rest (and its httpx/cryptography dependencies) is imported inside
+# main() so that importing this module stays cheap
+if TYPE_CHECKING:
+    from libdyson_rest import DysonClient
+    from libdyson_rest.models import IoTData
+
+# orjson is optional; the stdlib encoder is used when it is not installed
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent IoT credential requests
+MAX_IOT_WORKERS = 8
 
-def analyze_device_mqtt_info(device: Any, iot_data: Any, client: DysonClient) -> None:
-    """Analyze and display MQTT information for a device."""
-    print(f"\n📱 Device: {device.name}")
-    print("=" * 50)
+# Topic suffixes under "<root>/<serial>/status/"
+_STATUS_SUFFIXES = ("current", "faults", "software", "summary")
+_SENSOR_SUFFIXES = ("sensor", "environmental")
+
+# Topic groups written to the JSON export; sensor topics are report-only
+_EXPORTED_TOPIC_KEYS = ("status", "commands")
+
+# Display labels for the keys returned by build_mqtt_topics
+_TOPIC_LABELS = {
+    "status": "Status Topics",
+    "commands": "Command Topics",
+    "sensor": "Sensor Topics",
+}
+
+
+def build_mqtt_topics(device: Any) -> dict[str, list[str]]:
+    """Build the expected MQTT topics for a connected device."""
+    root_topic = device.connected_configuration.mqtt.mqtt_root_topic_level
+    base_topic = f"{root_topic}/{device.serial_number}"
+    return {
+        "status": [f"{base_topic}/status/{suffix}" for suffix in _STATUS_SUFFIXES],
+        "commands": [f"{base_topic}/command"],
+        "sensor": [f"{base_topic}/status/{suffix}" for suffix in _SENSOR_SUFFIXES],
+    }
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize export data as indented JSON, preferring orjson."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    import json
+
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def analyze_device_mqtt_info(
+    device: Any, iot_data: Any, client: DysonClient, topics: dict[str, list[str]]
+) -> tuple[str | None, str | None]:
+    """Analyze and display MQTT information for a device.
+
+    The report is collected into a list and written to stdout in one call.
+    Returns the decrypted local broker password and, if decryption failed,
+    the error message; either may be None.
+    """
+    out: list[str] = []
+    out.append(f"\n📱 Device: {device.name}")
+    out.append("=" * 50)
 
     # Basic device info
-    print("🔧 Device Information:")
-    print(f"   Serial Number: {device.serial_number}")
-    print(f"   Type: {device.type}")
-    print(f"   Model: {device.model}")
-    print(f"   Category: {device.category.value}")
-    print(f"   Connection: {device.connection_category.value}")
+    out.append("🔧 Device Information:")
+    out.append(f"   Serial Number: {device.serial_number}")
+    out.append(f"   Type: {device.type}")
+    out.append(f"   Model: {device.model}")
+    out.append(f"   Category: {device.category.value}")
+    out.append(f"   Connection: {device.connection_category.value}")
     if device.variant:
-        print(f"   Variant: {device.variant}")
+        out.append(f"   Variant: {device.variant}")
 
     # Connected configuration (MQTT broker info)
     decrypted_password = None
+    decrypt_error = None
     config = None
 
     if device.connected_configuration:
-        print("\n🌐 Connected Configuration:")
+        out.append("\n🌐 Connected Configuration:")
         config = device.connected_configuration
 
-        print("   📡 MQTT Configuration:")
+        out.append("   📡 MQTT Configuration:")
         encrypted_password = config.mqtt.local_broker_credentials
-        print(f"      Local Broker Credentials (encrypted): {encrypted_password}")
+        out.append(f"      Local Broker Credentials (encrypted): {encrypted_password}")
 
         # Decrypt the local broker password
         try:
             decrypted_password = client.decrypt_local_credentials(
                 encrypted_password, device.serial_number
             )
-            print(f"      Local Broker Password (decrypted): {decrypted_password}")
+            out.append(f"      Local Broker Password (decrypted): {decrypted_password}")
         except Exception as e:
-            print(f"      ⚠️  Failed to decrypt password: {e}")
+            decrypt_error = str(e)
+            out.append(f"      ⚠️  Failed to decrypt password: {decrypt_error}")
             decrypted_password = None
 
-        print(f"      MQTT Root Topic Level: {config.mqtt.mqtt_root_topic_level}")
-        print(f"      Remote Broker Type: {config.mqtt.remote_broker_type.value}")
+        out.append(f"      MQTT Root Topic Level: {config.mqtt.mqtt_root_topic_level}")
+        out.append(f"      Remote Broker Type: {config.mqtt.remote_broker_type.value}")
 
-        print("   💾 Firmware Information:")
-        print(f"      Version: {config.firmware.version}")
-        print(f"      Auto Update Enabled: {config.firmware.auto_update_enabled}")
-        print(f"      New Version Available: {config.firmware.new_version_available}")
+        out.append("   💾 Firmware Information:")
+        out.append(f"      Version: {config.firmware.version}")
+        out.append(f"      Auto Update Enabled: {config.firmware.auto_update_enabled}")
+        out.append(
+            f"      New Version Available: {config.firmware.new_version_available}"
+        )
 
         if config.firmware.capabilities:
-            print("      Capabilities:")
+            out.append("      Capabilities:")
             for cap in config.firmware.capabilities:
-                print(f"         - {cap.value}")
+                out.append(f"         - {cap.value}")
     else:
-        print("\n⚠️  No connected configuration available")
+        out.append("\n⚠️  No connected configuration available")
 
     # IoT Data (AWS IoT connection info)
-    print("\n☁️  AWS IoT Configuration:")
-    print(f"   Endpoint: {iot_data.endpoint}")
-    print(f"   Client ID: {iot_data.iot_credentials.client_id}")
-    print(f"   Custom Authorizer: {iot_data.iot_credentials.custom_authorizer_name}")
-    print(f"   Token Key: {iot_data.iot_credentials.token_key}")
-    print(f"   Token Value: {iot_data.iot_credentials.token_value}")
-    print(f"   Token Signature: {iot_data.iot_credentials.token_signature}")
+    out.append("\n☁️  AWS IoT Configuration:")
+    out.append(f"   Endpoint: {iot_data.endpoint}")
+    out.append(f"   Client ID: {iot_data.iot_credentials.client_id}")
+    out.append(
+        f"   Custom Authorizer: {iot_data.iot_credentials.custom_authorizer_name}"
+    )
+    out.append(f"   Token Key: {iot_data.iot_credentials.token_key}")
+    out.append(f"   Token Value: {iot_data.iot_credentials.token_value}")
+    out.append(f"   Token Signature: {iot_data.iot_credentials.token_signature}")
 
     # Inferred MQTT topics based on Dyson patterns
-    print("\n📨 Expected MQTT Topics:")
-
-    # Use the MQTT root topic from the device configuration
-    # Note: This should always be available for connected devices
-    root_topic = device.connected_configuration.mqtt.mqtt_root_topic_level
-    base_topic = f"{root_topic}/{device.serial_number}"
-
-    topics = {
-        "Status Topics": [
-            f"{base_topic}/status/current",
-            f"{base_topic}/status/faults",
-            f"{base_topic}/status/software",
-            f"{base_topic}/status/summary",
-        ],
-        "Command Topics": [f"{base_topic}/command"],
-        "Sensor Topics": [
-            f"{base_topic}/status/sensor",
-            f"{base_topic}/status/environmental",
-        ],
-    }
+    out.append("\n📨 Expected MQTT Topics:")
 
     for category, topic_list in topics.items():
-        print(f"   {category}:")
+        out.append(f"   {_TOPIC_LABELS[category]}:")
         for topic in topic_list:
-            print(f"      - {topic}")
+            out.append(f"      - {topic}")
 
     # MQTT connection parameters for external client
-    print("\n🔗 MQTT Connection Parameters (for external client):")
-
-    print("   ☁️  AWS IoT (Remote Connection):")
-    print(f"      Host: {iot_data.endpoint}")
-    print("      Port: 443 (MQTT over WebSockets with TLS)")
-    print(f"      Client ID: {iot_data.iot_credentials.client_id}")
-    print("      Protocol: MQTT over WebSockets")
-    print("      TLS: Required (AWS IoT)")
-    print("      Authentication: Custom Authorizer")
-    print(
+    out.append("\n🔗 MQTT Connection Parameters (for external client):")
+
+    out.append("   ☁️  AWS IoT (Remote Connection):")
+    out.append(f"      Host: {iot_data.endpoint}")
+    out.append("      Port: 443 (MQTT over WebSockets with TLS)")
+    out.append(f"      Client ID: {iot_data.iot_credentials.client_id}")
+    out.append("      Protocol: MQTT over WebSockets")
+    out.append("      TLS: Required (AWS IoT)")
+    out.append("      Authentication: Custom Authorizer")
+    out.append(
         f"         Authorizer Name: {iot_data.iot_credentials.custom_authorizer_name}"
     )
-    print(f"         Token Key Header: {iot_data.iot_credentials.token_key}")
-    print(f"         Token Value: {iot_data.iot_credentials.token_value}")
-    print(f"         Token Signature: {iot_data.iot_credentials.token_signature}")
+    out.append(f"         Token Key Header: {iot_data.iot_credentials.token_key}")
+    out.append(f"         Token Value: {iot_data.iot_credentials.token_value}")
+    out.append(f"         Token Signature: {iot_data.iot_credentials.token_signature}")
 
     # Local MQTT connection info
     if device.connected_configuration and decrypted_password and config:
-        print("\n   🏠 Local MQTT Broker (Direct Device Connection):")
-        print(f"      Host: {device.name}.local (or device IP address)")
-        print("      Port: 1883 (MQTT) or 8883 (MQTT over TLS)")
-        print(f"      Username: {device.serial_number}")
-        print(f"      Password: {decrypted_password}")
-        print("      Client ID: Any unique identifier")
-        print("      Protocol: MQTT (plain or TLS)")
-        print(f"      Root Topic: {config.mqtt.mqtt_root_topic_level}")
+        out.append("\n   🏠 Local MQTT Broker (Direct Device Connection):")
+        out.append(f"      Host: {device.name}.local (or device IP address)")
+        out.append("      Port: 1883 (MQTT) or 8883 (MQTT over TLS)")
+        out.append(f"      Username: {device.serial_number}")
+        out.append(f"      Password: {decrypted_password}")
+        out.append("      Client ID: Any unique identifier")
+        out.append("      Protocol: MQTT (plain or TLS)")
+        out.append(f"      Root Topic: {config.mqtt.mqtt_root_topic_level}")
+
+    sys.stdout.write("\n".join(out) + "\n")
+    return decrypted_password, decrypt_error
 
 
 def main() -> None:  # noqa: C901
+    from getpass import getpass
+
+    from libdyson_rest import (
+        DysonAPIError,
+        DysonAuthError,
+        DysonClient,
+        DysonConnectionError,
+    )
+
+    # Configure logging
+    logging.basicConfig(level=logging.INFO)
+
     print("🔍 Dyson MQTT Information Analyzer")
     print("=" * 50)
     print("This tool extracts MQTT connection information from the Dyson API")
@@ -178,121 +234,133 @@ def main() -> None:  # noqa: C901
             devices = client.get_devices()
             print(f"\n📱 Found {len(devices)} device(s)")
 
-            # Analyze each device
+            # Skip non-connected devices - this library is for REST/WebSocket API
+            # connected devices only
+            connected_devices = []
             for device in devices:
-                # Skip non-connected devices - this library is for REST/WebSocket API
-                # connected devices only
                 if not device.connected_configuration:
                     print(
                         f"⚠️  Skipping {device.name} - no connected configuration "
                         f"available"
                     )
                     continue
-
-                try:
-                    # Get IoT credentials
-                    iot_data = client.get_iot_credentials(device.serial_number)
-
-                    # Analyze MQTT info
-                    analyze_device_mqtt_info(device, iot_data, client)
-
-                    # Get MQTT root topic for connected devices
-                    root_topic = (
-                        device.connected_configuration.mqtt.mqtt_root_topic_level
+                connected_devices.append(device)
+
+            # Fetch IoT credentials for all devices concurrently; the client's
+            # underlying HTTP session is safe to share between threads. The
+            # same pool later performs the JSON export writes.
+            iot_futures: dict[str, Future[IoTData]] = {}
+            export_futures: list[tuple[Any, str, Future[int]]] = []
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(MAX_IOT_WORKERS, len(connected_devices)))
+            ) as executor:
+                for device in connected_devices:
+                    iot_futures[device.serial_number] = executor.submit(
+                        client.get_iot_credentials, device.serial_number
                     )
 
-                    # Export data for external use
-                    mqtt_info = {
-                        "device": {
-                            "name": device.name,
-                            "serial": device.serial_number,
-                            "type": device.type,
-                            "model": device.model,
-                            "category": device.category.value,
-                            "connection_category": device.connection_category.value,
-                            "variant": device.variant,
-                        },
-                        "mqtt_connection": {
-                            "endpoint": iot_data.endpoint,
-                            "port": 443,
-                            "protocol": "mqtt_over_websockets",
-                            "tls_required": True,
-                            "client_id": str(iot_data.iot_credentials.client_id),
-                            "auth": {
-                                "type": "custom_authorizer",
-                                "authorizer_name": (
-                                    iot_data.iot_credentials.custom_authorizer_name
-                                ),
-                                "token_key": iot_data.iot_credentials.token_key,
-                                "token_value": str(
-                                    iot_data.iot_credentials.token_value
-                                ),
-                                "token_signature": (
-                                    iot_data.iot_credentials.token_signature
-                                ),
+                # Analyze each device
+                for device in connected_devices:
+                    try:
+                        # Get IoT credentials
+                        iot_data = iot_futures[device.serial_number].result()
+
+                        # Topics are shared by the console report and the export
+                        topics = build_mqtt_topics(device)
+
+                        # Analyze MQTT info
+                        decrypted_password, decrypt_error = analyze_device_mqtt_info(
+                            device, iot_data, client, topics
+                        )
+
+                        # Export data for external use
+                        mqtt_info = {
+                            "device": {
+                                "name": device.name,
+                                "serial": device.serial_number,
+                                "type": device.type,
+                                "model": device.model,
+                                "category": device.category.value,
+                                "connection_category": device.connection_category.value,
+                                "variant": device.variant,
+                            },
+                            "mqtt_connection": {
+                                "endpoint": iot_data.endpoint,
+                                "port": 443,
+                                "protocol": "mqtt_over_websockets",
+                                "tls_required": True,
+                                "client_id": str(iot_data.iot_credentials.client_id),
+                                "auth": {
+                                    "type": "custom_authorizer",
+                                    "authorizer_name": (
+                                        iot_data.iot_credentials.custom_authorizer_name
+                                    ),
+                                    "token_key": iot_data.iot_credentials.token_key,
+                                    "token_value": str(
+                                        iot_data.iot_credentials.token_value
+                                    ),
+                                    "token_signature": (
+                                        iot_data.iot_credentials.token_signature
+                                    ),
+                                },
+                            },
+                            "topics": {
+                                key: topics[key] for key in _EXPORTED_TOPIC_KEYS
                             },
-                        },
-                        "topics": {
-                            "status": [
-                                f"{root_topic}/{device.serial_number}/status/current",
-                                f"{root_topic}/{device.serial_number}/status/faults",
-                                f"{root_topic}/{device.serial_number}/status/software",
-                                f"{root_topic}/{device.serial_number}/status/summary",
-                            ],
-                            "commands": [
-                                f"{root_topic}/{device.serial_number}/command"
-                            ],
-                        },
-                    }
-
-                    # Add connected configuration if available
-                    if device.connected_configuration:
-                        mqtt_config: dict[str, Any] = {
-                            "local_broker_credentials_encrypted": (
-                                device.connected_configuration.mqtt.local_broker_credentials
-                            ),
-                            "mqtt_root_topic_level": (
-                                device.connected_configuration.mqtt.mqtt_root_topic_level
-                            ),
-                            "remote_broker_type": (
-                                device.connected_configuration.mqtt.remote_broker_type.value
-                            ),
                         }
 
-                        # Try to decrypt local credentials
-                        try:
-                            decrypted_password = client.decrypt_local_credentials(
-                                device.connected_configuration.mqtt.local_broker_credentials,
-                                device.serial_number,
-                            )
-                            mqtt_config["local_mqtt_connection"] = {
-                                "host": f"{device.name}.local",
-                                "port": 1883,
-                                "port_tls": 8883,
-                                "username": device.serial_number,
-                                "password": decrypted_password,
-                                "protocol": "mqtt",
-                                "tls_available": True,
-                                "root_topic": (
-                                    device.connected_configuration.mqtt.mqtt_root_topic_level
+                        # Add connected configuration if available
+                        if device.connected_configuration:
+                            mqtt = device.connected_configuration.mqtt
+                            mqtt_config: dict[str, Any] = {
+                                "local_broker_credentials_encrypted": (
+                                    mqtt.local_broker_credentials
                                 ),
+                                "mqtt_root_topic_level": mqtt.mqtt_root_topic_level,
+                                "remote_broker_type": mqtt.remote_broker_type.value,
                             }
-                        except Exception as e:
-                            mqtt_config["local_mqtt_error"] = (
-                                f"Failed to decrypt password: {e}"
-                            )
 
-                        mqtt_info["device_mqtt_config"] = mqtt_config
+                            # Reuse the password decrypted for the console report
+                            if decrypted_password:
+                                mqtt_config["local_mqtt_connection"] = {
+                                    "host": f"{device.name}.local",
+                                    "port": 1883,
+                                    "port_tls": 8883,
+                                    "username": device.serial_number,
+                                    "password": decrypted_password,
+                                    "protocol": "mqtt",
+                                    "tls_available": True,
+                                    "root_topic": mqtt.mqtt_root_topic_level,
+                                }
+                            else:
+                                mqtt_config["local_mqtt_error"] = (
+                                    f"Failed to decrypt password: {decrypt_error}"
+                                )
+
+                            mqtt_info["device_mqtt_config"] = mqtt_config
+
+                        # Save to JSON file for external clients; the write runs
+                        # on the pool while the next device is analyzed
+                        filename = f"mqtt_info_{device.serial_number}.json"
+                        export_futures.append(
+                            (
+                                device,
+                                filename,
+                                executor.submit(
+                                    Path(filename).write_bytes, dump_json(mqtt_info)
+                                ),
+                            )
+                        )
 
-                    # Save to JSON file for external clients
-                    filename = f"mqtt_info_{device.serial_number}.json"
-                    with open(filename, "w") as f:
-                        json.dump(mqtt_info, f, indent=2)
+                    except Exception as e:
+                        print(f"❌ Error analyzing device {device.name}: {e}")
 
+            for device, filename, write_future in export_futures:
+                try:
+                    write_future.result()
                     print(f"\n💾 MQTT info exported to: {filename}")
-
-                except Exception as e:
-                    print(f"❌ Error analyzing device {device.name}: {e}")
+                except OSError as e:
+                    print(f"❌ Error exporting device {device.name}: {e}")
 
             print(
                 f"\n✅ Analysis complete! Found MQTT information for "
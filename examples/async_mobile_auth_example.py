@@ -11,6 +11,9 @@ Mobile numbers must include the country code prefix (e.g., '+8613800000000').
 import asyncio
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+from _event_loop import run_example
 
 from libdyson_rest import AsyncDysonClient
 from libdyson_rest.exceptions import DysonAPIError, DysonAuthError, DysonConnectionError
@@ -22,9 +25,22 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Threads in the default executor used for blocking prompts
+PROMPT_WORKERS = 4
+
+
+async def ainput(prompt: str) -> str:
+    """Read a line from stdin in a worker thread so the event loop stays live."""
+    return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
 
 async def main() -> None:
     """Demonstrate async mobile authentication flow."""
+    # ainput() runs in the default executor; a small pool is plenty for prompts
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=PROMPT_WORKERS)
+    )
+
     # Configuration - Get from environment variables for security
     mobile = os.getenv("DYSON_MOBILE")  # e.g., '+8613800000000'
     password = os.getenv("DYSON_PASSWORD")
@@ -85,10 +101,8 @@ async def main() -> None:
 
         # Step 5: Wait for user to receive and enter OTP code
         logger.info("Step 5: Waiting for OTP code from SMS...")
-        # Note: input() is blocking, so in a real async app
-        # you'd want to use async input or a GUI.
-        # For this example, it's acceptable.
-        otp_code = input("Enter the OTP code received via SMS: ").strip()
+        # The prompt runs in a worker thread so other tasks keep running
+        otp_code = (await ainput("Enter the OTP code received via SMS: ")).strip()
 
         if not otp_code:
             logger.error("No OTP code provided")
@@ -176,5 +190,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    # Run the async main function
-    asyncio.run(main())
+    run_example(main())
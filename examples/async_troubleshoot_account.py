@@ -13,9 +13,12 @@ import asyncio
 import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from getpass import getpass
 from typing import Any
 
+from _event_loop import run_example
+
 from libdyson_rest import (
     AsyncDysonClient,
     DysonAPIError,
@@ -23,6 +26,14 @@ from libdyson_rest import (
     DysonConnectionError,
 )
 
+# Threads in the default executor used for blocking prompts
+PROMPT_WORKERS = 4
+
+
+async def ainput(prompt: str) -> str:
+    """Read a line from stdin in a worker thread so the event loop stays live."""
+    return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
 
 # Configure comprehensive debug logging
 def setup_debug_logging() -> None:
@@ -104,8 +115,8 @@ def output_authentication_info(
         "account_status": user_status.account_status.value,
         "authentication_method": user_status.authentication_method.value,
         "token_type": login_info.token_type.value,
-        "bearer_token": str(login_info.token),
-        "bearer_token_preview": f"{str(login_info.token)[:20]}...",
+        "bearer_token": login_info.token,
+        "bearer_token_preview": f"{login_info.token[:20]}...",
     }
 
     print(f"   Account ID: {auth_info['account_id']}")
@@ -525,7 +536,7 @@ async def _complete_authentication(client: AsyncDysonClient, email: str) -> Any:
     print("✅ Login challenge received.")
 
     print(f"\n📧 Step 4: OTP sent to {email}")
-    otp_code = input("Enter the OTP code from your email: ").strip()
+    otp_code = (await ainput("Enter the OTP code from your email: ")).strip()
     if not otp_code:
         print("❌ OTP code is required")
         return None
@@ -614,6 +625,11 @@ def _output_final_summary(troubleshooting_data: dict[str, Any]) -> None:
 
 async def main() -> None:
     """Main entry point."""
+    # ainput() runs in the default executor; a small pool is plenty for prompts
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=PROMPT_WORKERS)
+    )
+
     try:
         await run_troubleshooting()
     except KeyboardInterrupt:
@@ -623,4 +639,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_example(main())
@@ -13,6 +13,13 @@ The Dyson API uses a two-step authentication process:
 import asyncio
 import logging
 import os
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import httpx
+from _event_loop import run_example
 
 from libdyson_rest import AsyncDysonClient, DysonAuthError, DysonConnectionError
 
@@ -20,6 +27,112 @@ from libdyson_rest import AsyncDysonClient, DysonAuthError, DysonConnectionError
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent requests issued by the concurrency examples
+MAX_CONCURRENT_REQUESTS = 10
+
+# Connection pool sizing shared by every client in these examples: enough
+# connections for MAX_CONCURRENT_REQUESTS, with idle ones kept for reuse
+HTTP_LIMITS = httpx.Limits(
+    max_connections=2 * MAX_CONCURRENT_REQUESTS,
+    max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+    keepalive_expiry=300,
+)
+
+# Examples run concurrently by main(), and how many may wait in its queue
+EXAMPLE_WORKERS = 4
+EXAMPLE_QUEUE_SIZE = 16
+
+# HTTP statuses treated as "back off" signals from the API
+OVERLOAD_STATUSES = frozenset({429, 502, 503})
+
+T = TypeVar("T")
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter with a simple circuit breaker.
+
+    Each successful call raises the concurrency limit by ``increase``; each
+    overload response (HTTP 429/502/503) multiplies it by ``decrease`` and
+    honours any ``Retry-After`` header. After ``failure_threshold``
+    consecutive overloads the circuit opens and calls fail fast until
+    ``cooldown`` seconds have passed.
+    """
+
+    def __init__(
+        self,
+        initial: float = 2,
+        maximum: float = MAX_CONCURRENT_REQUESTS,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+    ) -> None:
+        self.limit = initial
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._in_flight = 0
+        self._failures = 0
+        self._open_until = 0.0
+        self._retry_at = 0.0
+        self._condition = asyncio.Condition()
+
+    async def wait_if_throttled(self) -> None:
+        """Fail fast while the circuit is open and sleep out any Retry-After."""
+        now = time.monotonic()
+        if now < self._open_until:
+            raise DysonConnectionError("Circuit open: Dyson API is overloaded")
+        if now < self._retry_at:
+            await asyncio.sleep(self._retry_at - now)
+
+    async def run(self, func: Callable[[], Awaitable[T]]) -> T:
+        """Run ``func`` once a concurrency slot is free, adjusting the limit."""
+        await self.wait_if_throttled()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+
+        try:
+            result = await func()
+        except DysonConnectionError as e:
+            response = getattr(e.__cause__, "response", None)
+            if isinstance(response, httpx.Response) and (
+                response.status_code in OVERLOAD_STATUSES
+            ):
+                self._on_overload(response)
+            raise
+        else:
+            self._failures = 0
+            self.limit = min(self.maximum, self.limit + self.increase)
+            return result
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _on_overload(self, response: httpx.Response) -> None:
+        self.limit = max(1.0, self.limit * self.decrease)
+        self._failures += 1
+
+        retry_after = response.headers.get("retry-after", "")
+        if retry_after.isdigit():
+            self._retry_at = time.monotonic() + int(retry_after)
+
+        if self._failures >= self.failure_threshold:
+            self._open_until = time.monotonic() + self.cooldown
+            self._failures = 0
+        logger.warning(
+            "⚠️  API overloaded (%s), concurrency limit now %d",
+            response.status_code,
+            self.limit,
+        )
+
+
+# Shared by every example so they back off together
+api_limiter = AdaptiveLimiter()
+
 
 async def basic_async_example() -> None:
     """Basic asynchronous usage example with two-step authentication."""
@@ -37,23 +150,24 @@ async def basic_async_example() -> None:
         country=country,
         culture=culture,
         timeout=30,
+        limits=HTTP_LIMITS,
     ) as client:
         try:
             # Step 1: Provision the API (required first call)
             logger.info("📡 Provisioning API access...")
             version = await client.provision()
-            logger.info(f"✅ API provisioned successfully, version: {version}")
+            logger.info("✅ API provisioned successfully, version: %s", version)
 
             # Step 2: Check user status (optional)
             logger.info("👤 Checking user account status...")
             user_status = await client.get_user_status()
-            logger.info(f"   Account Status: {user_status.account_status.value}")
-            logger.info(f"   Auth Method: {user_status.authentication_method.value}")
+            logger.info("   Account Status: %s", user_status.account_status.value)
+            logger.info("   Auth Method: %s", user_status.authentication_method.value)
 
             # Step 3: Begin login process
             logger.info("🔐 Beginning login process...")
             challenge = await client.begin_login()
-            logger.info(f"   Challenge ID: {challenge.challenge_id}")
+            logger.info("   Challenge ID: %s", challenge.challenge_id)
             logger.info("📧 Check your email for the OTP code!")
 
             # In a real scenario, you would wait for user input here
@@ -63,48 +177,52 @@ async def basic_async_example() -> None:
             )
 
             # Uncomment the following lines and provide real OTP when testing:
-            # otp_code = input("Enter OTP code from email: ")
+            # otp_code = await asyncio.to_thread(input, "Enter OTP code from email: ")
             # login_info = await client.complete_login(
             #     str(challenge.challenge_id), otp_code
             # )
-            # logger.info(f"✅ Authentication successful!")
-            # logger.info(f"   Account ID: {login_info.account}")
-            # logger.info(f"   Token Type: {login_info.token_type.value}")
+            # logger.info("✅ Authentication successful!")
+            # logger.info("   Account ID: %s", login_info.account)
+            # logger.info("   Token Type: %s", login_info.token_type.value)
 
             # # Step 4: Get devices
             # logger.info("📱 Getting device list...")
             # devices = await client.get_devices()
-            # logger.info(f"   Found {len(devices)} device(s)")
+            # logger.info("   Found %s device(s)", len(devices))
 
             # for device in devices:
-            #     logger.info(f"   📱 Device: {device.name} ({device.serial_number})")
-            #     logger.info(f"        Product Type: {device.product_type}")
-            #     logger.info(f"        Connection: {device.connection_category.value}")
+            #     logger.info(
+            #         "   📱 Device: %s (%s)", device.name, device.serial_number
+            #     )
+            #     logger.info("        Product Type: %s", device.product_type)
+            #     logger.info(
+            #         "        Connection: %s", device.connection_category.value
+            #     )
             #
             #     # Get IoT credentials for cloud MQTT connection
             #     try:
             #         iot_data = await client.get_iot_credentials(device.serial_number)
-            #         logger.info(f"    ☁️  AWS IoT Endpoint: {iot_data.endpoint}")
+            #         logger.info("    ☁️  AWS IoT Endpoint: %s", iot_data.endpoint)
             #     except Exception as e:
-            #         logger.warning(f"    Could not get IoT credentials: {e}")
+            #         logger.warning("    Could not get IoT credentials: %s", e)
 
         except DysonAuthError as e:
-            logger.error(f"❌ Authentication error: {e}")
+            logger.error("❌ Authentication error: %s", e)
         except DysonConnectionError as e:
-            logger.error(f"❌ Connection error: {e}")
+            logger.error("❌ Connection error: %s", e)
         except Exception as e:
-            logger.error(f"❌ Unexpected error: {e}")
+            logger.error("❌ Unexpected error: %s", e)
 
 
 async def context_manager_async_example() -> None:
     """Example using async context manager for automatic cleanup."""
     logger.info("🔄 Starting async context manager example")
 
-    async with AsyncDysonClient() as client:
+    async with AsyncDysonClient(limits=HTTP_LIMITS) as client:
         logger.info("✅ Client created and will be automatically closed")
-        logger.info(f"   Country: {client.country}")
-        logger.info(f"   Culture: {client.culture}")
-        logger.info(f"   Timeout: {client.timeout}s")
+        logger.info("   Country: %s", client.country)
+        logger.info("   Culture: %s", client.culture)
+        logger.info("   Timeout: %ss", client.timeout)
 
     # Client is automatically closed here
     logger.info("🔒 Client automatically closed")
@@ -124,7 +242,9 @@ async def step_by_step_async_auth_example() -> None:
         )
         return
 
-    async with AsyncDysonClient(email=email, password=password) as client:
+    async with AsyncDysonClient(
+        email=email, password=password, limits=HTTP_LIMITS
+    ) as client:
         try:
             # Step 1: Provision
             logger.info("1️⃣  Provisioning API...")
@@ -136,38 +256,51 @@ async def step_by_step_async_auth_example() -> None:
 
             # Step 3: Wait for OTP (in real usage)
             logger.info("3️⃣  OTP code sent to email")
-            logger.info(f"   Challenge ID: {challenge.challenge_id}")
+            logger.info("   Challenge ID: %s", challenge.challenge_id)
 
             # In a real application, you would prompt for OTP here
             logger.info("   💡 In real usage, prompt user for OTP code here")
 
             # Example of how to complete (commented out):
-            # otp_code = await get_otp_from_user()  # Your async input method
+            # otp_code = await asyncio.to_thread(input, "Enter OTP code: ")
             # login_info = await client.complete_login(
             #     str(challenge.challenge_id), otp_code
             # )
             # logger.info("4️⃣  Authentication completed!")
 
         except Exception as e:
-            logger.error(f"❌ Error in authentication flow: {e}")
+            logger.error("❌ Error in authentication flow: %s", e)
 
 
 async def concurrent_operations_example() -> None:
     """Example showing concurrent async operations."""
     logger.info("⚡ Starting concurrent operations example")
 
-    # Create multiple clients concurrently
-    async def create_client_task(client_id: int) -> str:
-        async with AsyncDysonClient(timeout=10):
-            await asyncio.sleep(0.1)  # Simulate some work
-            return f"Client {client_id} completed"
+    # Every task makes its own request, but they all share one client so the
+    # underlying HTTP connection pool (and its TLS sessions) is reused.
+    # The shared adaptive limiter caps in-flight work (at most
+    # MAX_CONCURRENT_REQUESTS) and backs off when the API signals overload.
+    async def create_client_task(client: AsyncDysonClient, task_id: int) -> str:
+        # Provisioning needs no credentials, so it works before login
+        version = await api_limiter.run(client.provision)
+        return f"Task {task_id} completed (API version {version})"
 
     # Run multiple tasks concurrently
-    tasks = [create_client_task(i) for i in range(3)]
-    results = await asyncio.gather(*tasks)
+    async with AsyncDysonClient(timeout=10, limits=HTTP_LIMITS) as client:
+        if sys.version_info >= (3, 11):
+            # TaskGroup schedules fewer callbacks per task than gather and
+            # cancels the remaining tasks if one of them fails
+            async with asyncio.TaskGroup() as tg:
+                handles = [
+                    tg.create_task(create_client_task(client, i)) for i in range(3)
+                ]
+            results = [handle.result() for handle in handles]
+        else:
+            tasks = [create_client_task(client, i) for i in range(3)]
+            results = await asyncio.gather(*tasks)
 
     for result in results:
-        logger.info(f"   ✅ {result}")
+        logger.info("   ✅ %s", result)
 
 
 async def token_reuse_example() -> None:
@@ -178,13 +311,15 @@ async def token_reuse_example() -> None:
     saved_token = os.getenv("DYSON_SAVED_TOKEN")
 
     if saved_token:
-        async with AsyncDysonClient(auth_token=saved_token) as client:
+        async with AsyncDysonClient(
+            auth_token=saved_token, limits=HTTP_LIMITS
+        ) as client:
             logger.info("✅ Using saved authentication token")
 
             try:
                 # Try to use the saved token
-                devices = await client.get_devices()
-                logger.info(f"   🎉 Token is valid! Found {len(devices)} devices")
+                devices = await api_limiter.run(client.get_devices)
+                logger.info("   🎉 Token is valid! Found %s devices", len(devices))
 
             except DysonAuthError:
                 logger.warning("   ⚠️  Saved token is invalid or expired")
@@ -200,24 +335,26 @@ async def error_handling_example() -> None:
     """Example of proper async error handling."""
     logger.info("🛡️  Starting error handling example")
 
-    async with AsyncDysonClient() as client:
-        # Test various error conditions
+    async with AsyncDysonClient(limits=HTTP_LIMITS) as client:
+        # Test various error conditions. Each of these fails fast: the
+        # client checks for a token (or email) locally before opening a
+        # connection, so no TLS handshake is made for any of them.
         try:
             await client.get_devices()  # Should fail - not authenticated
         except DysonAuthError as e:
-            logger.info(f"   ✅ Caught expected auth error: {e}")
+            logger.info("   ✅ Caught expected auth error: %s", e)
 
         try:
             await client.begin_login()  # Should fail - no email
         except DysonAuthError as e:
-            logger.info(f"   ✅ Caught expected auth error: {e}")
+            logger.info("   ✅ Caught expected auth error: %s", e)
 
         try:
             await client.get_iot_credentials(
                 "invalid_serial"
             )  # Should fail - not authenticated
         except DysonAuthError as e:
-            logger.info(f"   ✅ Caught expected auth error: {e}")
+            logger.info("   ✅ Caught expected auth error: %s", e)
 
 
 async def main() -> None:
@@ -234,19 +371,49 @@ async def main() -> None:
         ("Error Handling", error_handling_example),
     ]
 
-    for name, example_func in examples:
-        logger.info(f"\n📖 Running: {name}")
-        logger.info("-" * 30)
-        try:
-            await example_func()
-        except Exception as e:
-            logger.error(f"❌ Example failed: {e}")
-        logger.info("✅ Example completed")
-
+    queue: asyncio.Queue[tuple[str, Callable[[], Awaitable[None]]]] = asyncio.Queue(
+        maxsize=EXAMPLE_QUEUE_SIZE
+    )
+
+    async def consumer() -> None:
+        # Examples are independent and dominated by network latency, so
+        # several consumers run them concurrently; log output will interleave
+        while True:
+            name, example_func = await queue.get()
+            logger.info("\n📖 Running: %s", name)
+            logger.info("-" * 30)
+            started = time.perf_counter()
+            try:
+                await example_func()
+            except Exception as e:
+                logger.error("❌ Example failed: %s: %s", name, e)
+            else:
+                logger.info(
+                    "✅ Example completed: %s (%.3fs)",
+                    name,
+                    time.perf_counter() - started,
+                )
+            finally:
+                queue.task_done()
+
+    consumers = [asyncio.create_task(consumer()) for _ in range(EXAMPLE_WORKERS)]
+
+    # The bounded queue keeps memory flat however many examples are queued
+    started = time.perf_counter()
+    for item in examples:
+        await queue.put(item)
+    await queue.join()
+
+    for task in consumers:
+        task.cancel()
+    await asyncio.gather(*consumers, return_exceptions=True)
+
+    logger.info(
+        "⏱️  Ran %d examples in %.3fs", len(examples), time.perf_counter() - started
+    )
     logger.info("\n🎉 All async examples completed!")
     logger.info("=" * 50)
 
 
 if __name__ == "__main__":
-    # Run the async main function
-    asyncio.run(main())
+    run_example(main())
@@ -7,6 +7,7 @@ on the account, outputting key device information for analysis.
 """
 
 import logging
+import sys
 from getpass import getpass
 from typing import Any
 
@@ -17,12 +18,22 @@ from libdyson_rest import (
     DysonConnectionError,
 )
 
-# Configure logging
+# Configure logging; %(created).3f formats the record's epoch timestamp
+# directly, avoiding a localtime()/strftime() call for every log line
 logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    level=logging.INFO,
+    format="%(created).3f - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+# Separator printed under each device heading
+DEVICE_RULE = "-" * 40
+
+
+def enum_value_or_default(enum_obj: Any, default: str = "N/A") -> str:
+    """Return an enum member's value, or ``default`` when it is missing."""
+    return str(enum_obj.value) if enum_obj is not None else default
+
 
 def get_user_credentials() -> tuple[str | None, str | None, str, str]:
     """Get user credentials for API authentication."""
@@ -85,24 +96,21 @@ def authenticate_client(client: DysonClient, email: str) -> bool:
         return False
 
 
-def get_mqtt_root_topic(device: Any) -> str | None:
-    """Extract MQTT root topic from device configuration."""
-    if device.connected_configuration and device.connected_configuration.mqtt:
-        return str(device.connected_configuration.mqtt.mqtt_root_topic_level)
-    return None
+def get_mqtt_root_topic(connected_configuration: Any) -> str | None:
+    """Extract MQTT root topic from a device's connected configuration."""
+    if connected_configuration is None or not connected_configuration.mqtt:
+        return None
+    return str(connected_configuration.mqtt.mqtt_root_topic_level)
 
 
-def get_device_capabilities(device: Any) -> list[str]:
-    """Extract device capabilities from firmware configuration."""
-    if (
-        device.connected_configuration
-        and device.connected_configuration.firmware
-        and device.connected_configuration.firmware.capabilities
-    ):
-        return [
-            cap.value for cap in device.connected_configuration.firmware.capabilities
-        ]
-    return []
+def get_device_capabilities(connected_configuration: Any) -> tuple[str, ...]:
+    """Extract device capabilities from a device's connected configuration."""
+    if connected_configuration is None or not connected_configuration.firmware:
+        return ()
+    capabilities = connected_configuration.firmware.capabilities
+    if not capabilities:
+        return ()
+    return tuple(c.value for c in capabilities)
 
 
 def scan_devices(client: DysonClient) -> None:
@@ -124,33 +132,37 @@ def scan_devices(client: DysonClient) -> None:
             device_type = device.type or "N/A"
             variant = device.variant or "N/A"
             model = device.model or "N/A"
-            category = device.category.value if device.category else "N/A"
-            connection_category = (
-                device.connection_category.value
-                if device.connection_category
-                else "N/A"
-            )
-            mqtt_root_topic = get_mqtt_root_topic(device) or "N/A"
-            capabilities = get_device_capabilities(device)
+            category = enum_value_or_default(device.category)
+            connection_category = enum_value_or_default(device.connection_category)
+            # Resolve the connected configuration once for both helpers
+            connected_configuration = device.connected_configuration
+            mqtt_root_topic = get_mqtt_root_topic(connected_configuration) or "N/A"
+            capabilities = get_device_capabilities(connected_configuration)
             device_name = device.name if hasattr(device, "name") else f"Device {i}"
 
-            print(f"📱 Device #{i}: {device_name}")
-            print("-" * 40)
-            print(f"   Device Type:      {device_type}")
-            print(f"   Variant:          {variant}")
-            print(f"   Model:            {model}")
-            print(f"   Category:         {category}")
-            print(f"   Connection:       {connection_category}")
-            print(f"   MQTT Root Topic:  {mqtt_root_topic}")
-            print("   Capabilities:")
+            # Collect the device block and write it in one call
+            lines = [
+                f"📱 Device #{i}: {device_name}",
+                DEVICE_RULE,
+                f"   Device Type:      {device_type}",
+                f"   Variant:          {variant}",
+                f"   Model:            {model}",
+                f"   Category:         {category}",
+                f"   Connection:       {connection_category}",
+                f"   MQTT Root Topic:  {mqtt_root_topic}",
+                "   Capabilities:",
+            ]
             if capabilities:
-                for cap in capabilities:
-                    print(f"      • {cap}")
+                lines.extend(f"      • {cap}" for cap in capabilities)
             else:
-                print("      • No capabilities available (device may not be connected)")
+                lines.append(
+                    "      • No capabilities available (device may not be connected)"
+                )
 
             if i < len(devices):
-                print()  # Add blank line between devices except for the last one
+                lines.append("")  # Blank line between devices except after the last
+
+            sys.stdout.write("\n".join(lines) + "\n")
 
         print("\n" + "=" * 60)
         print(f"✅ Device scan completed! Total devices: {len(devices)}")
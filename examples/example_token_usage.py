@@ -5,102 +5,213 @@ Example demonstrating token-based authentication with libdyson-rest.
 This shows how to:
 1. Authenticate once and get a token
 2. Reuse the token for subsequent operations
+3. Persist the token so later runs skip the login/OTP flow
 """
 
+import json
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from getpass import getpass
+from pathlib import Path
 
-from libdyson_rest import DysonAuthError, DysonClient
+from libdyson_rest import Device, DysonAuthError, DysonClient
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent per-device requests
+MAX_DEVICE_WORKERS = 8
 
-def authenticate_and_get_token(email: str, password: str) -> str:
+# Where the bearer token is kept between runs, and for how long it is trusted
+TOKEN_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "libdyson-rest"
+    / "token.json"
+)
+TOKEN_LIFETIME = 24 * 3600
+
+
+def load_cached_token() -> tuple[str, str | None] | None:
+    """
+    Return the token saved by a previous run, if it has not expired.
+
+    A missing, unreadable or malformed cache file is treated as no token.
+
+    Returns:
+        (bearer token, API version from provisioning), or None if a fresh
+        login is needed
+    """
+    with suppress(OSError, ValueError, KeyError, TypeError):
+        data = json.loads(TOKEN_CACHE_FILE.read_text(encoding="utf-8"))
+        if time.time() < data["expires_at"]:
+            return str(data["token"]), data.get("api_version")
+    return None
+
+
+def save_token(token: str, api_version: str) -> None:
+    """
+    Save the token with its expiry time for reuse by later runs.
+
+    Failing to write the cache is not fatal; the next run simply logs in again.
+
+    Args:
+        token: Bearer token to persist
+        api_version: Version returned by the provisioning call for this token
+    """
+    payload = {
+        "token": token,
+        "api_version": api_version,
+        "expires_at": time.time() + TOKEN_LIFETIME,
+    }
+    with suppress(OSError):
+        TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # The token grants account access, so the file is created private
+        # (and an existing one is tightened) before the token is written
+        fd = os.open(TOKEN_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(payload))
+
+
+def clear_cached_token() -> None:
+    """Forget the saved token, e.g. after the API has rejected it."""
+    with suppress(OSError):
+        TOKEN_CACHE_FILE.unlink(missing_ok=True)
+
+
+def run_with_cached_token(token: str, api_version: str | None) -> bool:
+    """
+    Run the device operations with a token saved by a previous run.
+
+    Args:
+        token: Saved bearer token
+        api_version: API version saved with the token, if any
+
+    Returns:
+        False if the API rejected the token, which is then discarded so
+        this and later runs fall back to a fresh login
+    """
+    print(f"🎟️  Reusing saved token from {TOKEN_CACHE_FILE}")
+    with DysonClient(auth_token=token) as client:
+        try:
+            # The run that saved the token already provisioned, so unless
+            # the API version is unknown go straight to the device calls
+            if api_version is None:
+                client.provision()
+            use_token_for_device_operations(client)
+        except DysonAuthError as e:
+            print(f"⚠️  Saved token was rejected ({e}); logging in again\n")
+            clear_cached_token()
+            return False
+    return True
+
+
+def authenticate_and_get_token(client: DysonClient, email: str) -> tuple[str, str]:
     """
     Authenticate with Dyson API and return the bearer token.
 
     Args:
+        client: Client created with the account email and password
         email: Dyson account email
-        password: Dyson account password
 
     Returns:
-        Bearer token for future API calls
+        (bearer token for future API calls, API version from provisioning)
     """
     print("🔐 Step 1: Authenticating with Dyson API...")
 
-    # Create client for authentication
-    with DysonClient(email=email, password=password) as client:
-        # Perform full authentication flow
-        client.provision()
-        user_status = client.get_user_status()
-        print(f"   User status: {user_status.account_status.value}")
+    # Perform full authentication flow
+    api_version = client.provision()
+    user_status = client.get_user_status()
+    print(f"   User status: {user_status.account_status.value}")
 
-        # Begin login and get OTP
-        challenge = client.begin_login()
-        print(f"   📧 OTP sent to {email}")
+    # Begin login and get OTP
+    challenge = client.begin_login()
+    print(f"   📧 OTP sent to {email}")
 
-        # Get OTP from user
-        otp_code = input("   Enter OTP code: ").strip()
-        if not otp_code:
-            raise ValueError("OTP code is required")
+    # Get OTP from user
+    otp_code = input("   Enter OTP code: ").strip()
+    if not otp_code:
+        raise ValueError("OTP code is required")
 
-        # Complete login
-        login_info = client.complete_login(str(challenge.challenge_id), otp_code)
-        print("   ✅ Authentication successful!")
+    # Complete login
+    login_info = client.complete_login(str(challenge.challenge_id), otp_code)
+    print("   ✅ Authentication successful!")
 
-        return str(login_info.token)
+    return login_info.token, api_version
 
 
-def use_token_for_device_operations(token: str) -> None:
+def use_token_for_device_operations(client: DysonClient) -> None:
     """
-    Use an existing token to perform device operations.
+    Use an authenticated client to perform device operations.
+
+    Within one process the client that logged in is reused, keeping its
+    HTTP connection and provisioning; a separate process instead creates
+    ``DysonClient(auth_token=token)`` from the saved token.
 
     Args:
-        token: Bearer token from previous authentication
+        client: Client holding a bearer token
     """
     print("\n📱 Step 2: Using token for device operations...")
 
-    # Create client with existing token (no email/password needed)
-    with DysonClient(auth_token=token) as client:
-        # Provision is still required for any API operations
-        client.provision()
+    # Get devices using the token
+    devices = client.get_devices()
+    print(f"   Found {len(devices)} device(s)")
 
-        # Get devices using the token
-        devices = client.get_devices()
-        print(f"   Found {len(devices)} device(s)")
+    # Process devices concurrently (the sync client is blocking, so use
+    # threads); results come back in device order for stable output
+    if devices:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_DEVICE_WORKERS, len(devices))
+        ) as executor:
+            reports = list(executor.map(lambda d: process_device(client, d), devices))
+        for report in reports:
+            print("\n".join(report))
 
-        # Process each device
-        for device in devices:
-            print(f"\n   📱 Device: {device.name}")
-            print(f"      Serial: {device.serial_number}")
-            print(f"      Model: {device.model}")
-            print(f"      Type: {device.type}")
 
-            # Get IoT credentials for this device
-            try:
-                iot_data = client.get_iot_credentials(device.serial_number)
-                print(f"      AWS IoT Endpoint: {iot_data.endpoint}")
-                print(f"      Client ID: {iot_data.iot_credentials.client_id}")
-
-                # If device has local MQTT config, decrypt password
-                if device.connected_configuration:
-                    try:
-                        decrypted_password = client.decrypt_local_credentials(
-                            device.connected_configuration.mqtt.local_broker_credentials,
-                            device.serial_number,
-                        )
-                        print(f"      Local MQTT Password: {decrypted_password}")
-                        print(
-                            f"      Root Topic: "
-                            f"{device.connected_configuration.mqtt.mqtt_root_topic_level}"
-                        )
-                    except Exception as e:
-                        print(f"      ⚠️  Could not decrypt local password: {e}")
+def process_device(client: DysonClient, device: Device) -> list[str]:
+    """
+    Fetch IoT credentials and local MQTT details for a single device.
 
+    Args:
+        client: Authenticated Dyson client
+        device: Device to process
+
+    Returns:
+        Report lines describing the device
+    """
+    lines = [
+        f"\n   📱 Device: {device.name}",
+        f"      Serial: {device.serial_number}",
+        f"      Model: {device.model}",
+        f"      Type: {device.type}",
+    ]
+
+    # Get IoT credentials for this device
+    try:
+        iot_data = client.get_iot_credentials(device.serial_number)
+        lines.append(f"      AWS IoT Endpoint: {iot_data.endpoint}")
+        lines.append(f"      Client ID: {iot_data.iot_credentials.client_id}")
+
+        # If device has local MQTT config, decrypt password
+        if device.connected_configuration:
+            mqtt = device.connected_configuration.mqtt
+            try:
+                decrypted_password = client.decrypt_local_credentials(
+                    mqtt.local_broker_credentials, device.serial_number
+                )
+                lines.append(f"      Local MQTT Password: {decrypted_password}")
+                lines.append(f"      Root Topic: {mqtt.mqtt_root_topic_level}")
             except Exception as e:
-                print(f"      ❌ Error getting IoT credentials: {e}")
+                lines.append(f"      ⚠️  Could not decrypt local password: {e}")
+
+    except Exception as e:
+        lines.append(f"      ❌ Error getting IoT credentials: {e}")
+
+    return lines
 
 
 def main() -> None:
@@ -108,27 +219,35 @@ def main() -> None:
     print("=" * 50)
     print("This demonstrates authenticating once and reusing the token.\n")
 
-    # Get credentials
-    email = input("Enter your Dyson account email: ").strip()
-    if not email:
-        print("❌ Email is required")
-        return
-
-    password = getpass("Enter your Dyson account password: ").strip()
-    if not password:
-        print("❌ Password is required")
-        return
-
     try:
-        # Step 1: Authenticate and get token
-        token = authenticate_and_get_token(email, password)
-
-        print(f"\n🎟️  Authentication token obtained: {token[:20]}...")
-        print("   This token can be saved and reused for future API calls")
-        print("   (until it expires - typically 24-48 hours)")
-
-        # Step 2: Use token for device operations (simulating a separate session)
-        use_token_for_device_operations(token)
+        cached = load_cached_token()
+        if cached and run_with_cached_token(*cached):
+            print("\n✅ Example complete!")
+            return
+
+        # Get credentials
+        email = input("Enter your Dyson account email: ").strip()
+        if not email:
+            print("❌ Email is required")
+            return
+
+        password = getpass("Enter your Dyson account password: ").strip()
+        if not password:
+            print("❌ Password is required")
+            return
+
+        # One client (and HTTP session) serves both steps
+        with DysonClient(email=email, password=password) as client:
+            # Step 1: Authenticate and get token
+            token, api_version = authenticate_and_get_token(client, email)
+            save_token(token, api_version)
+
+            print(f"\n🎟️  Authentication token obtained: {token[:20]}...")
+            print(f"   Saved to {TOKEN_CACHE_FILE} for future runs")
+            print("   (until it expires - typically 24-48 hours)")
+
+            # Step 2: Use token for device operations
+            use_token_for_device_operations(client)
 
         print("\n✅ Example complete!")
         print("\n📝 Usage Summary:")
@@ -138,6 +257,7 @@ def main() -> None:
             "   3. Create new DysonClient(auth_token=token) for subsequent operations"
         )
         print("   4. No need for email/password/OTP on subsequent uses")
+        print("   5. Within one process, keep reusing the client that logged in")
 
     except (DysonAuthError, ValueError) as e:
         print(f"❌ Authentication error: {e}")
@@ -13,20 +13,27 @@ Usage:
 """
 
 import logging
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 
-from libdyson_rest import DysonClient
+from libdyson_rest import DysonClient, PendingRelease
 from libdyson_rest.exceptions import DysonAPIError
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent pending-release requests
+MAX_FIRMWARE_WORKERS = 10
 
-def check_firmware_info(client: DysonClient, serial_number: str) -> None:
-    """Check and display firmware information for a device."""
+
+def check_firmware_info(
+    serial_number: str, pending_future: Future[PendingRelease]
+) -> None:
+    """Display pending firmware information fetched in the background."""
     try:
         # Get pending release information
-        pending_release = client.get_pending_release(serial_number)
+        pending_release = pending_future.result()
 
         print(f"\n📋 Pending Release Info for {serial_number}:")
         print(f"  Pending Version: {pending_release.version}")
@@ -69,12 +76,26 @@ def main() -> None:
 
         print(f"✅ Found {len(devices)} device(s)")
 
+        # Fetch pending releases for all devices concurrently; the blocking
+        # client is shared across threads and results are printed in order
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_FIRMWARE_WORKERS, len(devices))
+        ) as executor:
+            pending_futures = {
+                device.serial_number: executor.submit(
+                    client.get_pending_release, device.serial_number
+                )
+                for device in devices
+            }
+
         for device in devices:
-            print(f"\n🔧 Device: {device.name}")
-            print(f"  Serial: {device.serial_number}")
-            print(f"  Model: {device.model}")
-            print(f"  Type: {device.type}")
-            print(f"  Category: {device.category.value}")
+            lines = [
+                f"\n🔧 Device: {device.name}",
+                f"  Serial: {device.serial_number}",
+                f"  Model: {device.model}",
+                f"  Type: {device.type}",
+                f"  Category: {device.category.value}",
+            ]
 
             # Check current firmware info
             if (
@@ -82,27 +103,25 @@ def main() -> None:
                 and device.connected_configuration.firmware
             ):
                 firmware = device.connected_configuration.firmware
-                print(f"  Current Firmware: {firmware.version}")
-                print(
-                    f"  Auto-update: "
-                    f"{'Enabled' if firmware.auto_update_enabled else 'Disabled'}"
-                )
-                print(
-                    f"  New Version Available: "
-                    f"{'Yes' if firmware.new_version_available else 'No'}"
-                )
+                auto_update = "Enabled" if firmware.auto_update_enabled else "Disabled"
+                new_version = "Yes" if firmware.new_version_available else "No"
+                lines.append(f"  Current Firmware: {firmware.version}")
+                lines.append(f"  Auto-update: {auto_update}")
+                lines.append(f"  New Version Available: {new_version}")
 
                 if firmware.minimum_app_version:
-                    print(f"  Min App Version: {firmware.minimum_app_version}")
+                    lines.append(f"  Min App Version: {firmware.minimum_app_version}")
 
                 if firmware.capabilities:
-                    print(
-                        f"  Capabilities: "
-                        f"{', '.join(cap.value for cap in firmware.capabilities)}"
-                    )
+                    capabilities = ", ".join(cap.value for cap in firmware.capabilities)
+                    lines.append(f"  Capabilities: {capabilities}")
+
+            sys.stdout.write("\n".join(lines) + "\n")
 
             # Check pending releases
-            check_firmware_info(client, device.serial_number)
+            check_firmware_info(
+                device.serial_number, pending_futures[device.serial_number]
+            )
 
     except KeyboardInterrupt:
         print("\n👋 Interrupted by user")
@@ -7,6 +7,10 @@ patterns that align with Home Assistant best practices.
 """
 
 import logging
+import os
+import sys
+from contextlib import AsyncExitStack
+from typing import Any
 
 from libdyson_rest import AsyncDysonClient, DysonClient
 from libdyson_rest.exceptions import DysonAPIError, DysonConnectionError
@@ -14,6 +18,27 @@ from libdyson_rest.exceptions import DysonAPIError, DysonConnectionError
 # This is how Home Assistant integrations typically set up their logger
 _LOGGER = logging.getLogger(__name__)
 
+# Library logger, looked up once rather than on every setup
+_LIBDYSON_LOGGER = logging.getLogger("libdyson_rest")
+
+# Printed when the example is run directly
+_BANNER = """\
+🏠 Home Assistant Integration Example
+🔧 This example shows proper logging patterns for HA integrations
+📝 See comments in the code for configuration details
+
+💡 To enable debug logging in Home Assistant:
+   Add this to your configuration.yaml:
+
+   logger:
+     logs:
+       custom_components.dyson: debug
+       libdyson_rest: debug
+
+🔍 When debug logging is enabled, set debug=True in client constructors
+   for detailed HTTP request/response logging
+"""
+
 
 class DysonDeviceManager:
     """
@@ -29,7 +54,15 @@ class DysonDeviceManager:
         self.email = email
         self.password = password
         self.country = country
-        self.debug = debug
+        # Detailed HTTP logging is only worth its per-request cost when the
+        # library's debug records will actually be emitted
+        self.debug = debug and _LIBDYSON_LOGGER.isEnabledFor(logging.DEBUG)
+
+        # Shared async client, created and provisioned on first use and
+        # closed by aclose(), so later calls skip the TLS and provision setup
+        self._stack: AsyncExitStack | None = None
+        self._client: AsyncDysonClient | None = None
+        self._api_version: str | None = None
 
         # In Home Assistant, debug mode can be controlled via configuration.yaml:
         # logger:
@@ -37,6 +70,43 @@ class DysonDeviceManager:
         #     custom_components.dyson: debug
         #     libdyson_rest: debug
 
+    async def __aenter__(self) -> "DysonDeviceManager":
+        """Enter the async context; the client itself is created lazily."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Exit the async context, closing the shared client."""
+        await self.aclose()
+
+    async def _get_client(self) -> AsyncDysonClient:
+        """Return the shared client, creating and provisioning it on first use."""
+        if self._client is None:
+            stack = AsyncExitStack()
+            # self.debug is only set when libdyson_rest debug logging is enabled
+            client = await stack.enter_async_context(
+                AsyncDysonClient(
+                    email=self.email,
+                    password=self.password,
+                    country=self.country,
+                    debug=self.debug,  # Enable detailed HTTP logging when debugging
+                )
+            )
+            try:
+                self._api_version = await client.provision()
+            except BaseException:
+                await stack.aclose()
+                raise
+            _LOGGER.debug("Dyson API version: %s", self._api_version)
+            self._stack, self._client = stack, client
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared client, if one was created."""
+        if self._stack is not None:
+            await self._stack.aclose()
+        self._stack = None
+        self._client = None
+
     async def async_setup(self) -> bool:
         """
         Set up the Dyson integration.
@@ -44,33 +114,20 @@ class DysonDeviceManager:
         In Home Assistant, this would be called during integration setup.
         """
         try:
-            # Use debug=True only when Home Assistant debug logging is enabled
-            # In a real integration, this would check the logger level:
-            # debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
-
-            async with AsyncDysonClient(
-                email=self.email,
-                password=self.password,
-                country=self.country,
-                debug=self.debug,  # Enable detailed HTTP logging when debugging
-            ) as client:
-                _LOGGER.info(
-                    "Setting up Dyson integration for country: %s", self.country
-                )
+            _LOGGER.info("Setting up Dyson integration for country: %s", self.country)
 
-                # Provision API access
-                version = await client.provision()
-                _LOGGER.debug("Dyson API version: %s", version)
+            # Provisioned once per manager, on first use
+            client = await self._get_client()
 
-                # Check user status
-                user_status = await client.get_user_status()
-                _LOGGER.debug("User authentication method: %s", user_status.auth_mode)
+            # Check user status
+            user_status = await client.get_user_status()
+            _LOGGER.debug("User authentication method: %s", user_status.auth_mode)
 
-                # Begin authentication
-                challenge_id = await client.begin_login()
-                _LOGGER.info("Authentication challenge started: %s", challenge_id)
+            # Begin authentication
+            challenge_id = await client.begin_login()
+            _LOGGER.info("Authentication challenge started: %s", challenge_id)
 
-                return True
+            return True
 
         except DysonConnectionError as e:
             _LOGGER.error("Failed to connect to Dyson API: %s", e)
@@ -127,11 +184,9 @@ def main() -> None:
     )
 
     # Enable debug logging for our library (this would be done by HA config)
-    logging.getLogger("libdyson_rest").setLevel(logging.DEBUG)
+    _LIBDYSON_LOGGER.setLevel(logging.DEBUG)
 
     # Example: Debug mode controlled by environment or configuration
-    import os
-
     debug_mode = os.getenv("DYSON_DEBUG", "false").lower() == "true"
 
     manager = DysonDeviceManager(
@@ -150,19 +205,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    print("🏠 Home Assistant Integration Example")
-    print("🔧 This example shows proper logging patterns for HA integrations")
-    print("📝 See comments in the code for configuration details")
-    print()
-
     # Don't actually run the setup without real credentials
-    print("💡 To enable debug logging in Home Assistant:")
-    print("   Add this to your configuration.yaml:")
-    print()
-    print("   logger:")
-    print("     logs:")
-    print("       custom_components.dyson: debug")
-    print("       libdyson_rest: debug")
-    print()
-    print("🔍 When debug logging is enabled, set debug=True in client constructors")
-    print("   for detailed HTTP request/response logging")
+    sys.stdout.write(_BANNER)
@@ -10,25 +10,52 @@ Mobile numbers must include the country code prefix (e.g., '+8613800000000').
 
 import logging
 import os
+from collections.abc import Callable
+
+import httpx
+from _logging import setup_example_logging
+from _retry import retry_with_backoff, wait_for_otp_send_slot
 
 from libdyson_rest import DysonClient
 from libdyson_rest.exceptions import DysonAPIError, DysonAuthError, DysonConnectionError
 
 # Configure logging to see authentication flow
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+setup_example_logging(logging.INFO)
 
 logger = logging.getLogger(__name__)
 
 
+# Regions whose API server supports mobile (SMS OTP) authentication
+_MOBILE_AUTH_REGIONS: frozenset[str] = frozenset({"CN"})
+
+# Keep idle connections for a minute (httpx defaults to 5 seconds), so
+# completing the login after a typical wait for the SMS reuses the open TLS
+# connection instead of handshaking again
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=1, keepalive_expiry=60)
+
+
+class LazyStr:
+    """Log argument whose text is only computed if the record is emitted."""
+
+    def __init__(self, fn: Callable[[], str]) -> None:
+        self.fn = fn
+
+    def __str__(self) -> str:
+        return self.fn()
+
+
 def main() -> None:
     """Demonstrate mobile authentication flow."""
     # Configuration - Get from environment variables for security
     mobile = os.getenv("DYSON_MOBILE")  # e.g., '+8613800000000'
     password = os.getenv("DYSON_PASSWORD")
-    country = "CN"  # Mobile auth only works on CN server
-    culture = "zh-CN"
+    # Mobile auth only works on the CN server, so other regions are refused
+    country = os.getenv("DYSON_COUNTRY", "CN").upper()
+    culture = os.getenv("DYSON_CULTURE", "zh-CN")
+
+    if country not in _MOBILE_AUTH_REGIONS:
+        logger.error("Mobile authentication is not available in region %s", country)
+        return
 
     if not mobile or not password:
         logger.error("Please set DYSON_MOBILE and DYSON_PASSWORD environment variables")
@@ -38,49 +65,50 @@ def main() -> None:
         return
 
     logger.info("=== Dyson Mobile Authentication Example ===")
-    logger.info(f"Mobile: {mobile[:6]}****")  # Mask mobile number
-    logger.info(f"Country: {country}")
-    logger.info(f"Culture: {culture}")
-    logger.info("")
+    logger.info("Mobile: %s****", LazyStr(lambda: mobile[:6]))  # Mask mobile number
+    logger.info("Country: %s", country)
+    logger.info("Culture: %s\n", culture)
 
     try:
         # Step 1: Initialize the client
         # Note: We still pass mobile in the email parameter for now, or use mobile
         # parameter in the specific methods
         logger.info("Step 1: Initializing Dyson client...")
+        # Detailed HTTP logging only helps if the library's debug records are
+        # actually emitted; otherwise it is per-request overhead
+        debug = logging.getLogger("libdyson_rest").isEnabledFor(logging.DEBUG)
         client = DysonClient(
             email=mobile,  # Can use email parameter for mobile
             password=password,
             country=country,
             culture=culture,
-            debug=True,
+            debug=debug,
+            limits=HTTP_LIMITS,
         )
-        logger.info("✓ Client initialized")
-        logger.info("")
+        logger.info("✓ Client initialized\n")
 
         # Step 2: Call provision endpoint (required before authentication)
         logger.info("Step 2: Calling provision endpoint...")
         client.provision()
-        logger.info("✓ Provision successful")
-        logger.info("")
+        logger.info("✓ Provision successful\n")
 
         # Step 3: Check user status with mobile number
         logger.info("Step 3: Checking user status with mobile number...")
         user_status = client.get_user_status_mobile(mobile)
-        logger.info(f"✓ User status retrieved: {user_status}")
-        logger.info(f"  - Authentication method: {user_status.authentication_method}")
-        logger.info(f"  - Account exists: {user_status.account_exists}")
-        logger.info("")
+        logger.info("✓ User status retrieved: %s", user_status)
+        logger.info("  - Authentication method: %s", user_status.authentication_method)
+        logger.info("  - Account exists: %s\n", user_status.account_exists)
 
         # Step 4: Begin login process (sends SMS OTP)
         logger.info("Step 4: Beginning login process (SMS OTP will be sent)...")
+        wait_for_otp_send_slot(mobile)  # Space out repeated SMS requests
         challenge = client.begin_login_mobile(mobile)
-        logger.info(f"✓ Login challenge created: {challenge.challenge_id}")
+        logger.info("✓ Login challenge created: %s", challenge.challenge_id)
         logger.info(
-            f"  - Challenge ID: "
-            f"{challenge.challenge_id[:8]}...{challenge.challenge_id[-8:]}"
+            "  - Challenge ID: %s...%s\n",
+            LazyStr(lambda: str(challenge.challenge_id)[:8]),
+            LazyStr(lambda: str(challenge.challenge_id)[-8:]),
         )
-        logger.info("")
 
         # Step 5: Wait for user to receive and enter OTP code
         logger.info("Step 5: Waiting for OTP code from SMS...")
@@ -90,49 +118,53 @@ def main() -> None:
             logger.error("No OTP code provided")
             return
 
-        logger.info("")
-
         # Step 6: Complete login with OTP code
-        logger.info("Step 6: Completing login with OTP code...")
-        login_info = client.complete_login_mobile(
-            challenge_id=challenge.challenge_id,
-            otp_code=otp_code,
-            mobile=mobile,
+        logger.info("\nStep 6: Completing login with OTP code...")
+        # Connection errors are retried with backoff; a rejected OTP is not
+        login_info = retry_with_backoff(
+            lambda: client.complete_login_mobile(
+                challenge_id=challenge.challenge_id,
+                otp_code=otp_code,
+                mobile=mobile,
+            )
         )
         logger.info("✓ Login successful!")
-        logger.info(f"  - Account ID: {login_info.account}")
-        logger.info(f"  - Token: {login_info.token[:20]}...")
-        logger.info("")
+        logger.info("  - Account ID: %s", login_info.account)
+        logger.info("  - Token: %s...\n", LazyStr(lambda: login_info.token[:20]))
 
         # Step 7: Get user's devices (requires authentication)
         logger.info("Step 7: Retrieving devices...")
         devices = client.get_devices()
-        logger.info(f"✓ Found {len(devices)} device(s):")
-
-        for i, device in enumerate(devices, 1):
-            logger.info(f"  Device {i}:")
-            logger.info(f"    - Name: {device.name}")
-            logger.info(f"    - Serial: {device.serial}")
-            logger.info(f"    - Product Type: {device.product_type}")
-            logger.info(f"    - Version: {device.version}")
-            logger.info("")
-
-        # Step 8: Get IoT credentials for first device (if any)
-        if devices:
+        num_devices = len(devices)
+        logger.info("✓ Found %s device(s):", num_devices)
+
+        if num_devices == 0:
+            logger.info("No devices on account")
+        else:
+            # Skip building the per-device report when INFO is filtered out
+            if logger.isEnabledFor(logging.INFO):
+                for i, device in enumerate(devices, 1):
+                    logger.info("  Device %s:", i)
+                    logger.info("    - Name: %s", device.name)
+                    logger.info("    - Serial: %s", device.serial)
+                    logger.info("    - Product Type: %s", device.product_type)
+                    logger.info("    - Version: %s\n", device.version)
+
+            # Step 8: Get IoT credentials for the first device
             device = devices[0]
-            logger.info(f"Step 8: Getting IoT credentials for device: {device.name}...")
+            logger.info(
+                "Step 8: Getting IoT credentials for device: %s...", device.name
+            )
             iot_data = client.get_iot_data(device.serial)
             logger.info("✓ IoT credentials retrieved:")
-            logger.info(f"  - Connection ID: {iot_data.connection_id}")
-            logger.info(f"  - MQTT Host: {iot_data.mqtt_host}")
-            logger.info(f"  - MQTT Port: {iot_data.mqtt_port}")
-            logger.info("")
+            logger.info("  - Connection ID: %s", iot_data.connection_id)
+            logger.info("  - MQTT Host: %s", iot_data.mqtt_host)
+            logger.info("  - MQTT Port: %s\n", iot_data.mqtt_port)
 
         logger.info("=== Mobile Authentication Example Completed Successfully ===")
 
     except DysonAuthError as e:
-        logger.error(f"Authentication error: {e}")
-        logger.info("")
+        logger.error("Authentication error: %s\n", e)
         logger.info("Common issues:")
         logger.info("  - Incorrect mobile number or password")
         logger.info("  - Invalid OTP code")
@@ -143,24 +175,21 @@ def main() -> None:
         )
 
     except DysonConnectionError as e:
-        logger.error(f"Connection error: {e}")
-        logger.info("")
+        logger.error("Connection error: %s\n", e)
         logger.info("Common issues:")
         logger.info("  - Network connectivity problems")
         logger.info("  - Dyson API server unavailable")
         logger.info("  - Firewall or proxy blocking connections")
 
     except DysonAPIError as e:
-        logger.error(f"API error: {e}")
-        logger.info("")
+        logger.error("API error: %s\n", e)
         logger.info("Common issues:")
         logger.info("  - Invalid API response format")
         logger.info("  - API endpoint changed")
         logger.info("  - Server-side error")
 
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
-        logger.exception("Full traceback:")
+        logger.exception("Unexpected error: %s", e)
 
 
 if __name__ == "__main__":
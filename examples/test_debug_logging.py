@@ -4,58 +4,62 @@ Test the debug logging functionality with a simple example.
 """
 
 import logging
-import sys
+
+from _logging import setup_example_logging
 
 from libdyson_rest import DysonClient
 from libdyson_rest.exceptions import DysonAPIError, DysonConnectionError
 
+# Library logger, looked up once rather than on every run
+_LIBDYSON_LOGGER = logging.getLogger("libdyson_rest")
+
 
 def test_debug_logging():
     """Test debug logging with fake credentials."""
     # Setup logging
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        stream=sys.stdout,
-    )
+    setup_example_logging(logging.DEBUG)
 
-    logging.getLogger("libdyson_rest").setLevel(logging.DEBUG)
+    _LIBDYSON_LOGGER.setLevel(logging.DEBUG)
 
     print("🔍 Testing debug logging with fake credentials...")
     print("🚫 This will fail authentication, but shows debug output")
     print()
 
-    try:
-        # Test with debug=True (detailed HTTP logging)
-        print("=== With debug=True (detailed HTTP logging) ===")
-        with DysonClient(
-            email="fake@example.com",
-            password="fake_password",
-            country="US",
-            debug=True,  # Enable detailed HTTP debug logging
-        ) as client:
+    # Only ask for detailed HTTP logging if libdyson_rest debug records will
+    # be emitted (a logging config may have raised the level)
+    effective_debug = _LIBDYSON_LOGGER.isEnabledFor(logging.DEBUG)
+
+    # One client (and HTTP connection pool) serves both probes; ``debug`` is
+    # read on every request, so it can be flipped between them
+    with DysonClient(
+        email="fake@example.com",
+        password="fake_password",
+        country="US",
+        debug=effective_debug,  # Enable detailed HTTP debug logging
+    ) as client:
+        try:
+            # Test with debug=True (detailed HTTP logging)
+            print("=== With debug=True (detailed HTTP logging) ===")
             version = client.provision()
             print(f"✅ API Version: {version}")
 
-    except (DysonConnectionError, DysonAPIError) as e:
-        print(f"Expected error (fake credentials): {e}")
+        except (DysonConnectionError, DysonAPIError) as e:
+            print(f"Expected error (fake credentials): {e}")
 
-    print()
+        print()
+
+        # Turn detailed logging back off, including httpx's own request logs
+        client.debug = False
+        logging.getLogger("httpx").setLevel(logging.WARNING)
 
-    try:
-        # Test with debug=False (minimal logging)
-        print("=== With debug=False (minimal logging) ===")
-        with DysonClient(
-            email="fake@example.com",
-            password="fake_password",
-            country="CN",  # Test China endpoint
-            debug=False,  # No detailed HTTP logging
-        ) as client:
+        try:
+            # Test with debug=False (minimal logging)
+            print("=== With debug=False (minimal logging) ===")
             version = client.provision()
             print(f"✅ API Version: {version}")
 
-    except (DysonConnectionError, DysonAPIError) as e:
-        print(f"Expected error (fake credentials): {e}")
+        except (DysonConnectionError, DysonAPIError) as e:
+            print(f"Expected error (fake credentials): {e}")
 
 
 if __name__ == "__main__":
@@ -6,48 +6,140 @@ This script tests the complete authentication flow with a real Dyson account,
 including all steps from provisioning to device enumeration.
 """
 
+import asyncio
+import json
 import logging
+import os
 import sys
-from getpass import getpass
+import time
+from contextlib import suppress
+from pathlib import Path
+
+from _logging import setup_example_logging
+from _retry import async_retry_with_backoff
 
 from libdyson_rest import (
+    AsyncDysonClient,
     DysonAPIError,
     DysonAuthError,
-    DysonClient,
     DysonConnectionError,
 )
 
 # Configure logging to see what's happening
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+setup_example_logging(logging.INFO)
+
+# Opt-in cache of the provisioning result (DYSON_PROVISION_CACHE=1), so
+# repeated test runs skip the provisioning round-trip while it is fresh
+PROVISION_CACHE_ENABLED = os.getenv("DYSON_PROVISION_CACHE") == "1"
+PROVISION_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "libdyson-rest"
+    / "provision.json"
 )
+PROVISION_CACHE_TTL = 3600
+
+# Header printed at the start of run_auth_test()
+_BANNER = f"""\
+🔧 libdyson-rest Authentication Test
+{"=" * 50}
+
+This will test the complete authentication flow with a real Dyson account.
+You'll need:
+  ✅ A valid Dyson account email
+  ✅ Your Dyson account password
+  ✅ Access to your email for the OTP code
+
+"""
+
+# Returned by get_user_credentials() when a required value is missing
+_NO_CREDENTIALS: tuple[None, None, str, str] = (None, None, "US", "en-US")
+
+
+def load_cached_provision(country: str) -> str | None:
+    """Return the cached API version for a country, if fresh."""
+    with suppress(OSError, ValueError, KeyError, TypeError):
+        data = json.loads(PROVISION_CACHE_FILE.read_text(encoding="utf-8"))
+        if (
+            data["country"] == country
+            and time.time() - data["ts"] < PROVISION_CACHE_TTL
+        ):
+            return str(data["version"])
+    return None
+
+
+def save_provision(country: str, version: str) -> None:
+    """Cache the API version returned by provisioning; failures are ignored."""
+    payload = {"country": country, "version": version, "ts": time.time()}
+    with suppress(OSError):
+        PROVISION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        PROVISION_CACHE_FILE.write_text(json.dumps(payload), encoding="utf-8")
+
+
+async def provision_client(client: AsyncDysonClient, country: str) -> str:
+    """Provision the client, reusing a cached result when enabled and fresh."""
+    if PROVISION_CACHE_ENABLED:
+        version = load_cached_provision(country)
+        if version is not None:
+            return version
 
+    version = await client.provision()
+    if PROVISION_CACHE_ENABLED:
+        save_provision(country, version)
+    return version
 
-def get_user_credentials() -> tuple[str | None, str | None, str, str]:
+
+async def get_user_credentials() -> tuple[str | None, str | None, str, str]:
     """Get user credentials for testing."""
-    email = input("Enter your Dyson account email: ").strip()
+    # Prompts run in a worker thread so they don't block the event loop
+    email = (await asyncio.to_thread(input, "Enter your Dyson account email: ")).strip()
     if not email:
         print("❌ Email is required")
-        return None, None, "US", "en-US"
+        return _NO_CREDENTIALS
+
+    # Imported here so merely importing this module doesn't load getpass
+    from getpass import getpass
 
-    password = getpass("Enter your Dyson account password: ").strip()
+    password = (
+        await asyncio.to_thread(getpass, "Enter your Dyson account password: ")
+    ).strip()
     if not password:
         print("❌ Password is required")
-        return None, None, "US", "en-US"
+        return _NO_CREDENTIALS
 
     # Optional: country and culture
     print()
-    country = input("Enter your country code (default: US): ").strip().upper() or "US"
-    culture = input("Enter your locale (default: en-US): ").strip() or "en-US"
+    country = (
+        await asyncio.to_thread(input, "Enter your country code (default: US): ")
+    ).strip().upper() or "US"
+    culture = (
+        await asyncio.to_thread(input, "Enter your locale (default: en-US): ")
+    ).strip() or "en-US"
 
     return email, password, country, culture
 
 
-def test_devices(client: DysonClient) -> None:
+async def test_devices(client: AsyncDysonClient) -> None:
     """Test device enumeration and IoT credentials."""
     print("\n📱 Testing device enumeration...")
-    devices = client.get_devices()
+    devices = await client.get_devices()
     print(f"   ✅ Found {len(devices)} device(s)")
+    if not devices:
+        print("   ℹ️  No devices found on this account")
+        return
+
+    # Fetch IoT credentials for all connected devices concurrently, so the
+    # wait is roughly one round-trip rather than one per device
+    connected = [d for d in devices if d.connection_category.value != "nonConnected"]
+    if connected:
+        print(f"\n   🌐 Getting IoT credentials for {len(connected)} device(s)...")
+    results = await asyncio.gather(
+        *(client.get_iot_credentials(d.serial_number) for d in connected),
+        return_exceptions=True,
+    )
+    iot_results = {
+        device.serial_number: result
+        for device, result in zip(connected, results, strict=True)
+    }
 
     for device in devices:
         print(f"\n   📱 Device: {device.name}")
@@ -55,36 +147,24 @@ def test_devices(client: DysonClient) -> None:
         print(f"      Type: {device.type}")
         print(f"      Connection: {device.connection_category.value}")
 
-        # Test IoT credentials for connected devices
-        if device.connection_category.value != "nonConnected":
-            try:
-                print("     🌐 Getting IoT credentials...")
-                iot_data = client.get_iot_credentials(device.serial_number)
+        # Report IoT credentials for connected devices
+        if device.serial_number in iot_results:
+            iot_data = iot_results[device.serial_number]
+            if isinstance(iot_data, BaseException):
+                print(f"     ⚠️  IoT credentials failed: {iot_data}")
+            else:
                 print(f"     ✅ IoT Endpoint: {iot_data.endpoint}")
                 print(f"     ✅ Client ID: {iot_data.iot_credentials.client_id}")
-            except Exception as e:
-                print(f"     ⚠️  IoT credentials failed: {e}")
         else:
             print("     ℹ️  Device not connected - no IoT credentials available")
 
-    if not devices:
-        print("   ℹ️  No devices found on this account")
-
 
-def run_auth_test() -> None:  # noqa: C901
+async def run_auth_test() -> None:  # noqa: C901
     """Run the authentication test - complex for demonstration purposes."""
-    print("🔧 libdyson-rest Authentication Test")
-    print("=" * 50)
-    print()
-    print("This will test the complete authentication flow with a real Dyson account.")
-    print("You'll need:")
-    print("  ✅ A valid Dyson account email")
-    print("  ✅ Your Dyson account password")
-    print("  ✅ Access to your email for the OTP code")
-    print()
+    sys.stdout.write(_BANNER)
 
     # Get credentials
-    email, password, country, culture = get_user_credentials()
+    email, password, country, culture = await get_user_credentials()
     if not email or not password:
         return
 
@@ -93,59 +173,63 @@ def run_auth_test() -> None:  # noqa: C901
     print()
 
     try:
-        # Initialize client
-        client = DysonClient(
+        # Initialize client; the session is closed on every exit path
+        async with AsyncDysonClient(
             email=email, password=password, country=country, culture=culture
-        )
-        print(f"✅ Client initialized for {email} in {country} ({culture})")
-
-        # Step 1: Provision
-        print("\n📡 Step 1: Provisioning API access...")
-        version = client.provision()
-        print("✅ API provisioned successfully!")
-        print(f"   API Version: {version}")
-
-        # Step 2: Get user status
-        print("\n👤 Step 2: Checking account status...")
-        user_status = client.get_user_status()
-        print("✅ Account status retrieved!")
-        print(f"   Status: {user_status.account_status.value}")
-        print(f"   Auth Method: {user_status.authentication_method.value}")
-
-        if user_status.account_status.value != "ACTIVE":
-            print(f"⚠️  Account is not active: {user_status.account_status.value}")
-            return
-
-        # Step 3: Begin login
-        print("\n🔐 Step 3: Beginning login process...")
-        challenge = client.begin_login()
-        print("✅ Login challenge received!")
-        print(f"   Challenge ID: {challenge.challenge_id}")
-
-        # Step 4: Complete login
-        print(f"\n📧 Step 4: OTP sent to {email}")
-        print("   Check your email for the verification code...")
-
-        otp_code = input("Enter the OTP code from your email: ").strip()
-        if not otp_code:
-            print("❌ OTP code is required")
-            return
-
-        login_info = client.complete_login(str(challenge.challenge_id), otp_code)
-        print("✅ Authentication completed successfully!")
-        print(f"   Account ID: {login_info.account}")
-        print(f"   Token Type: {login_info.token_type.value}")
-        print(f"   Token: {login_info.token[:20]}...")
-
-        # Test device functionality
-        test_devices(client)
-
-        print("\n🎉 All tests completed successfully!")
-        print(f"   Bearer Token: {client.get_auth_token()}")
-        print("   You can now use this token for future API calls")
-
-        # Always close the client
-        client.close()
+        ) as client:
+            print(f"✅ Client initialized for {email} in {country} ({culture})")
+
+            # Step 1: Provision
+            print("\n📡 Step 1: Provisioning API access...")
+            version = await provision_client(client, country)
+            print("✅ API provisioned successfully!")
+            print(f"   API Version: {version}")
+
+            # Step 2: Get user status
+            print("\n👤 Step 2: Checking account status...")
+            user_status = await client.get_user_status()
+            print("✅ Account status retrieved!")
+            account_status = user_status.account_status.value
+            print(f"   Status: {account_status}")
+            print(f"   Auth Method: {user_status.authentication_method.value}")
+
+            if account_status != "ACTIVE":
+                print(f"⚠️  Account is not active: {account_status}")
+                return
+
+            # Step 3: Begin login
+            print("\n🔐 Step 3: Beginning login process...")
+            challenge = await client.begin_login()
+            print("✅ Login challenge received!")
+            print(f"   Challenge ID: {challenge.challenge_id}")
+
+            # Step 4: Complete login
+            print(f"\n📧 Step 4: OTP sent to {email}")
+            print("   Check your email for the verification code...")
+
+            otp_code = (
+                await asyncio.to_thread(input, "Enter the OTP code from your email: ")
+            ).strip()
+            if not otp_code:
+                print("❌ OTP code is required")
+                return
+
+            # Connection errors are retried with backoff; a rejected OTP is not
+            login_info = await async_retry_with_backoff(
+                lambda: client.complete_login(str(challenge.challenge_id), otp_code)
+            )
+            print("✅ Authentication completed successfully!")
+            print(f"   Account ID: {login_info.account}")
+            print(f"   Token Type: {login_info.token_type.value}")
+            print(f"   Token: {login_info.token[:20]}...")
+
+            # Test device functionality
+            await test_devices(client)
+
+            print("\n🎉 All tests completed successfully!")
+            print(f"   Bearer Token: {client.get_auth_token()}")
+            print("   You can now use this token for future API calls")
+
         print("\n🔒 Client session closed")
 
     except ValueError as e:
@@ -165,7 +249,7 @@ def run_auth_test() -> None:  # noqa: C901
 def main() -> None:
     """Main entry point."""
     try:
-        run_auth_test()
+        asyncio.run(run_auth_test())
     except KeyboardInterrupt:
         print("\n❌ Cancelled by user")
         sys.exit(1)
@@ -7,12 +7,22 @@ and outputs all available API information for troubleshooting purposes.
 Combines authentication testing with detailed device and MQTT analysis.
 """
 
+import argparse
+import datetime
+import hashlib
 import json
 import logging
+import os
 import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from getpass import getpass
+from pathlib import Path
 from typing import Any
 
+import httpx
+
 from libdyson_rest import (
     DysonAPIError,
     DysonAuthError,
@@ -20,6 +30,19 @@ from libdyson_rest import (
     DysonConnectionError,
 )
 
+# orjson is optional; the stdlib encoder is used when it is not installed
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Rules drawn under section, subsection and per-device headers
+_SECTION_RULE = "=" * 60
+_SUB_RULE = "-" * 40
+_DEVICE_RULE = "─" * 60
+
 
 # Configure comprehensive debug logging
 def setup_debug_logging() -> None:
@@ -37,12 +60,56 @@ def setup_debug_logging() -> None:
     print("🔍 DEBUG LOGGING ENABLED")
     print("📡 HTTP request/response details will be shown when debug=True is used")
     print("🌐 Regional endpoint selection will be logged")
-    print("=" * 60)
+    print(_SECTION_RULE)
 
 
 setup_debug_logging()
 logger = logging.getLogger(__name__)
 
+# Skip the per-device report and rely on the JSON export alone (--quiet)
+QUIET = False
+
+# Keep-alive pool for the client: the provisioning, login, device and
+# per-device credential calls all reuse one TLS connection, and idle
+# connections survive the OTP prompt (httpx drops them after 5 seconds)
+HTTP_LIMITS = httpx.Limits(
+    max_connections=16, max_keepalive_connections=4, keepalive_expiry=120
+)
+
+# Upper bound on concurrent IoT credential requests
+IOT_FETCH_WORKERS = 8
+
+# Status topics published by connected devices under <root>/<serial>/status/
+_MQTT_STATUS_SUFFIXES = (
+    "current",
+    "faults",
+    "software",
+    "summary",
+    "sensor",
+    "environmental",
+)
+
+# Non-secret fingerprints (firmware version and a hash of the encrypted local
+# credentials) from the last clean run, so re-runs can point out devices whose
+# configuration changed in between. Every device is still analyzed live;
+# --no-cache disables reading and writing the file
+DEVICE_CACHE_ENABLED = True
+DEVICE_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "libdyson-rest"
+    / "troubleshoot_devices.json"
+)
+
+# Summary counters in report order, with their display labels
+_SUMMARY_COUNTERS = (
+    ("total_devices", "Total Devices"),
+    ("connected_devices", "Connected Devices"),
+    ("devices_with_local_config", "Devices with Local Config"),
+    ("devices_with_iot_credentials", "Devices with IoT Credentials"),
+    ("devices_with_pending_firmware", "Devices with Pending Firmware"),
+    ("devices_with_pushed_firmware", "Devices with Pushed Firmware"),
+)
+
 
 def get_user_credentials() -> tuple[str | None, str | None, str, str]:
     """Get user credentials for testing."""
@@ -68,17 +135,26 @@ def get_user_credentials() -> tuple[str | None, str | None, str, str]:
     return email, password, country, culture
 
 
+class _Error(str):
+    """Error message stored in place of a value that could not be obtained."""
+
+    __slots__ = ()
+
+
+def _report(text: str) -> None:
+    """Write a line of the per-device report unless running quietly."""
+    if not QUIET:
+        sys.stdout.write(text + "\n")
+
+
 def print_section(title: str) -> None:
     """Print a formatted section header."""
-    print(f"\n{'=' * 60}")
-    print(f"📊 {title}")
-    print("=" * 60)
+    print(f"\n{_SECTION_RULE}\n📊 {title}\n{_SECTION_RULE}")
 
 
 def print_subsection(title: str) -> None:
     """Print a formatted subsection header."""
-    print(f"\n🔍 {title}")
-    print("-" * 40)
+    print(f"\n🔍 {title}\n{_SUB_RULE}")
 
 
 def output_authentication_info(
@@ -87,33 +163,47 @@ def output_authentication_info(
     """Output comprehensive authentication information."""
     print_section("AUTHENTICATION INFORMATION")
 
+    account_id = str(login_info.account)
+    account_status = user_status.account_status.value
+    authentication_method = user_status.authentication_method.value
+    token_type = login_info.token_type.value
+    token = login_info.token
+    token_preview = f"{token[:20]}..."
+
+    print(f"   Account ID: {account_id}")
+    print(f"   Email: {client.email}")
+    print(f"   Country: {client.country}")
+    print(f"   Locale: {client.culture}")
+    print(f"   Account Status: {account_status}")
+    print(f"   Auth Method: {authentication_method}")
+    print(f"   Token Type: {token_type}")
+    print(f"   Bearer Token: {token_preview}")
+
     auth_info = {
-        "account_id": str(login_info.account),
+        "account_id": account_id,
         "email": client.email,
         "country": client.country,
         "culture": client.culture,
-        "account_status": user_status.account_status.value,
-        "authentication_method": user_status.authentication_method.value,
-        "token_type": login_info.token_type.value,
-        "bearer_token": str(login_info.token),
-        "bearer_token_preview": f"{str(login_info.token)[:20]}...",
+        "account_status": account_status,
+        "authentication_method": authentication_method,
+        "token_type": token_type,
+        "bearer_token": token,
+        "bearer_token_preview": token_preview,
     }
 
-    print(f"   Account ID: {auth_info['account_id']}")
-    print(f"   Email: {auth_info['email']}")
-    print(f"   Country: {auth_info['country']}")
-    print(f"   Locale: {auth_info['culture']}")
-    print(f"   Account Status: {auth_info['account_status']}")
-    print(f"   Auth Method: {auth_info['authentication_method']}")
-    print(f"   Token Type: {auth_info['token_type']}")
-    print(f"   Bearer Token: {auth_info['bearer_token_preview']}")
-
     return auth_info
 
 
-def analyze_device_details(device: Any, client: DysonClient) -> dict[str, Any]:
-    """Analyze and output comprehensive device information."""
+def analyze_device_details(
+    device: Any, client: DysonClient, iot_result: Any = None
+) -> dict[str, Any]:
+    """Analyze and output comprehensive device information.
+
+    ``iot_result`` is the device's pre-fetched IoT credentials, or the
+    exception raised while fetching them.
+    """
     device_info = _initialize_device_info(device)
+    conn_cat = device_info["basic_info"]["connection_category"]
 
     print_subsection(f"Device: {device.name}")
     _print_basic_device_info(device)
@@ -123,20 +213,20 @@ def analyze_device_details(device: Any, client: DysonClient) -> dict[str, Any]:
         config_info = _analyze_device_configuration(device, client)
         device_info["connected_configuration"] = config_info
     else:
-        print("\n   ⚠️  No connected configuration available")
+        _report("\n   ⚠️  No connected configuration available")
 
     # Analyze pending firmware releases
     pending_release_info = _analyze_pending_firmware(device, client)
     device_info["pending_firmware"] = pending_release_info
 
     # Analyze IoT credentials
-    if device.connection_category.value != "nonConnected":
-        iot_info = _analyze_iot_credentials(device, client)
+    if conn_cat != "nonConnected":
+        iot_info = _analyze_iot_credentials(iot_result)
         device_info["iot_credentials"] = iot_info
 
         if (
             iot_info
-            and not isinstance(iot_info, str)
+            and not isinstance(iot_info, _Error)
             and device.connected_configuration
         ):
             _analyze_mqtt_topics(device)
@@ -174,20 +264,22 @@ def _initialize_device_info(device: Any) -> dict[str, Any]:
 
 def _print_basic_device_info(device: Any) -> None:
     """Print basic device information."""
-    print("   📱 Basic Information:")
-    print(f"      Name: {device.name}")
-    print(f"      Serial Number: {device.serial_number}")
-    print(f"      Type: {device.type}")
-    print(f"      Model: {device.model}")
-    print(f"      Category: {device.category.value}")
-    print(f"      Connection: {device.connection_category.value}")
+    out = ["   📱 Basic Information:"]
+    out.append(f"      Name: {device.name}")
+    out.append(f"      Serial Number: {device.serial_number}")
+    out.append(f"      Type: {device.type}")
+    out.append(f"      Model: {device.model}")
+    out.append(f"      Category: {device.category.value}")
+    out.append(f"      Connection: {device.connection_category.value}")
     if device.variant:
-        print(f"      Variant: {device.variant}")
+        out.append(f"      Variant: {device.variant}")
+
+    _report("\n".join(out))
 
 
 def _analyze_device_configuration(device: Any, client: DysonClient) -> dict[str, Any]:
     """Analyze device connected configuration."""
-    print("\n   🌐 Connected Configuration:")
+    out = ["\n   🌐 Connected Configuration:"]
     config = device.connected_configuration
 
     capabilities = []
@@ -210,10 +302,10 @@ def _analyze_device_configuration(device: Any, client: DysonClient) -> dict[str,
         },
     }
 
-    print(f"      MQTT Root Topic: {config_info['mqtt']['mqtt_root_topic_level']}")
-    print(f"      Remote Broker Type: {config_info['mqtt']['remote_broker_type']}")
+    out.append(f"      MQTT Root Topic: {config_info['mqtt']['mqtt_root_topic_level']}")
+    out.append(f"      Remote Broker Type: {config_info['mqtt']['remote_broker_type']}")
     encrypted_creds = config_info["mqtt"]["local_broker_credentials_encrypted"]
-    print(f"      Encrypted Local Credentials: {encrypted_creds[:50]}...")
+    out.append(f"      Encrypted Local Credentials: {encrypted_creds[:50]}...")
 
     # Try to decrypt local MQTT password
     try:
@@ -221,36 +313,39 @@ def _analyze_device_configuration(device: Any, client: DysonClient) -> dict[str,
             config.mqtt.local_broker_credentials, device.serial_number
         )
         config_info["mqtt"]["local_broker_credentials_decrypted"] = decrypted_password
-        print(f"      ✅ Decrypted Local Password: {decrypted_password}")
+        out.append(f"      ✅ Decrypted Local Password: {decrypted_password}")
     except Exception as e:
         error_msg = f"Failed to decrypt: {e}"
-        config_info["mqtt"]["local_broker_credentials_decrypted"] = (
+        config_info["mqtt"]["local_broker_credentials_decrypted"] = _Error(
             f"ERROR: {error_msg}"
         )
-        print(f"      ❌ Local Password Decryption: {error_msg}")
+        out.append(f"      ❌ Local Password Decryption: {error_msg}")
 
-    print("\n      💾 Firmware Information:")
-    print(f"         Version: {config_info['firmware']['version']}")
-    print(f"         Auto Update: {config_info['firmware']['auto_update_enabled']}")
-    print(
+    out.append("\n      💾 Firmware Information:")
+    out.append(f"         Version: {config_info['firmware']['version']}")
+    out.append(
+        f"         Auto Update: {config_info['firmware']['auto_update_enabled']}"
+    )
+    out.append(
         f"         New Version Available: "
         f"{config_info['firmware']['new_version_available']}"
     )
     if config_info["firmware"]["minimum_app_version"]:
-        print(
+        out.append(
             f"         Min App Version: "
             f"{config_info['firmware']['minimum_app_version']}"
         )
     if config_info["firmware"]["capabilities"]:
         capabilities_str = ", ".join(config_info["firmware"]["capabilities"])
-        print(f"         Capabilities: {capabilities_str}")
+        out.append(f"         Capabilities: {capabilities_str}")
 
+    _report("\n".join(out))
     return config_info
 
 
 def _analyze_pending_firmware(device: Any, client: DysonClient) -> dict[str, Any]:
     """Analyze pending firmware releases for the device."""
-    print("\n   🔄 Pending Firmware Information:")
+    _report("\n   🔄 Pending Firmware Information:")
 
     try:
         pending_release = client.get_pending_release(device.serial_number)
@@ -261,20 +356,20 @@ def _analyze_pending_firmware(device: Any, client: DysonClient) -> dict[str, Any
             "available": True,
         }
 
-        print("      ✅ Pending Release Available:")
-        print(f"         Version: {pending_info['version']}")
-        print(f"         Update Pushed: {'Yes' if pending_info['pushed'] else 'No'}")
+        _report("      ✅ Pending Release Available:")
+        _report(f"         Version: {pending_info['version']}")
+        _report(f"         Update Pushed: {'Yes' if pending_info['pushed'] else 'No'}")
 
         if pending_info["pushed"]:
-            print("         🎯 Firmware update has been pushed to the device")
+            _report("         🎯 Firmware update has been pushed to the device")
         else:
-            print("         ⏳ Firmware update is available but not yet pushed")
+            _report("         ⏳ Firmware update is available but not yet pushed")
 
         return pending_info
 
     except DysonAPIError as e:
         error_msg = f"API error: {e}"
-        print(f"      ❌ Failed to get pending release info: {error_msg}")
+        _report(f"      ❌ Failed to get pending release info: {error_msg}")
         return {
             "available": False,
             "error": error_msg,
@@ -283,7 +378,7 @@ def _analyze_pending_firmware(device: Any, client: DysonClient) -> dict[str, Any
         }
     except Exception as e:
         error_msg = f"Unexpected error: {e}"
-        print(f"      ❌ Failed to get pending release info: {error_msg}")
+        _report(f"      ❌ Failed to get pending release info: {error_msg}")
         return {
             "available": False,
             "error": error_msg,
@@ -292,11 +387,20 @@ def _analyze_pending_firmware(device: Any, client: DysonClient) -> dict[str, Any
         }
 
 
-def _analyze_iot_credentials(device: Any, client: DysonClient) -> Any:
-    """Analyze IoT credentials for the device."""
+def _safe_get_iot(client: DysonClient, serial_number: str) -> Any:
+    """Fetch IoT credentials, returning the exception instead of raising it."""
+    try:
+        return client.get_iot_credentials(serial_number)
+    except Exception as e:
+        return e
+
+
+def _analyze_iot_credentials(iot_data: Any) -> Any:
+    """Analyze pre-fetched IoT credentials for the device."""
     try:
-        print("\n   ☁️  AWS IoT Credentials:")
-        iot_data = client.get_iot_credentials(device.serial_number)
+        _report("\n   ☁️  AWS IoT Credentials:")
+        if isinstance(iot_data, BaseException):
+            raise iot_data
 
         iot_info = {
             "endpoint": iot_data.endpoint,
@@ -311,81 +415,78 @@ def _analyze_iot_credentials(device: Any, client: DysonClient) -> Any:
             },
         }
 
-        print(f"      AWS IoT Endpoint: {iot_info['endpoint']}")
-        print(f"      Client ID: {iot_info['credentials']['client_id']}")
-        print(
+        _report(f"      AWS IoT Endpoint: {iot_info['endpoint']}")
+        _report(f"      Client ID: {iot_info['credentials']['client_id']}")
+        _report(
             f"      Custom Authorizer: "
             f"{iot_info['credentials']['custom_authorizer_name']}"
         )
-        print(f"      Token Key: {iot_info['credentials']['token_key']}")
-        print(f"      Token Value: {iot_info['credentials']['token_value']}")
+        _report(f"      Token Key: {iot_info['credentials']['token_key']}")
+        _report(f"      Token Value: {iot_info['credentials']['token_value']}")
         signature_preview = iot_info["credentials"]["token_signature"][:50]
-        print(f"      Token Signature: {signature_preview}...")
+        _report(f"      Token Signature: {signature_preview}...")
 
         return iot_info
 
     except Exception as e:
         error_msg = f"Failed to get IoT credentials: {e}"
-        print(f"      ❌ IoT Credentials Error: {error_msg}")
-        return f"ERROR: {error_msg}"
+        _report(f"      ❌ IoT Credentials Error: {error_msg}")
+        return _Error(f"ERROR: {error_msg}")
 
 
 def _analyze_mqtt_topics(device: Any) -> None:
     """Analyze MQTT topics for the device."""
-    print("\n   📨 MQTT Topics:")
+    if QUIET:
+        return
+
+    out = ["\n   📨 MQTT Topics:"]
 
     # Use the MQTT root topic from the device configuration
     # Note: This should always be available for connected devices
     root_topic = device.connected_configuration.mqtt.mqtt_root_topic_level
     base_topic = f"{root_topic}/{device.serial_number}"
 
-    status_topics = [
-        f"{base_topic}/status/current",
-        f"{base_topic}/status/faults",
-        f"{base_topic}/status/software",
-        f"{base_topic}/status/summary",
-        f"{base_topic}/status/sensor",
-        f"{base_topic}/status/environmental",
-    ]
+    out.append(f"      Base Topic: {base_topic}")
+    out.append("      Status Topics:")
+    out.extend(
+        f"         - {base_topic}/status/{suffix}" for suffix in _MQTT_STATUS_SUFFIXES
+    )
+    out.append("      Command Topics:")
+    out.append(f"         - {base_topic}/command")
 
-    print(f"      Base Topic: {base_topic}")
-    print("      Status Topics:")
-    for topic in status_topics:
-        print(f"         - {topic}")
-    print("      Command Topics:")
-    print(f"         - {base_topic}/command")
+    _report("\n".join(out))
 
 
 def _analyze_cloud_mqtt_config(iot_info: dict[str, Any]) -> None:
     """Analyze cloud MQTT connection configuration."""
-    print("\n   🌐 Cloud MQTT Connection Parameters:")
-    print(f"      Host: {iot_info['endpoint']}")
-    print("      Port: 443")
-    print("      Protocol: MQTT over WebSockets with TLS")
-    print(f"      Client ID: {iot_info['credentials']['client_id']}")
-    print("      Auth Type: AWS IoT Custom Authorizer")
-    print(f"      Authorizer: {iot_info['credentials']['custom_authorizer_name']}")
+    if QUIET:
+        return
+
+    _report("\n   🌐 Cloud MQTT Connection Parameters:")
+    _report(f"      Host: {iot_info['endpoint']}")
+    _report("      Port: 443")
+    _report("      Protocol: MQTT over WebSockets with TLS")
+    _report(f"      Client ID: {iot_info['credentials']['client_id']}")
+    _report("      Auth Type: AWS IoT Custom Authorizer")
+    _report(f"      Authorizer: {iot_info['credentials']['custom_authorizer_name']}")
 
 
 def _analyze_local_mqtt_config(device: Any, device_info: dict[str, Any]) -> None:
     """Analyze local MQTT connection configuration."""
-    print("\n   � Local MQTT Connection Parameters:")
-    print(f"      Host: {device.name}.local (or device IP)")
-    print("      MQTT Port: 1883")
-    print("      MQTT+TLS Port: 8883")
-    print(f"      Username: {device.serial_number}")
+    _report("\n   � Local MQTT Connection Parameters:")
+    _report(f"      Host: {device.name}.local (or device IP)")
+    _report("      MQTT Port: 1883")
+    _report("      MQTT+TLS Port: 8883")
+    _report(f"      Username: {device.serial_number}")
 
     password = device_info["connected_configuration"]["mqtt"][
         "local_broker_credentials_decrypted"
     ]
-    if isinstance(password, str) and not password.startswith("ERROR:"):
-        print(f"      Password: {password}")
-    else:
-        print(f"      Password: {password}")
+    _report(f"      Password: {password}")
 
-    print("      Protocol: MQTT (plain or TLS)")
+    _report("      Protocol: MQTT (plain or TLS)")
     root_topic = device_info["connected_configuration"]["mqtt"]["mqtt_root_topic_level"]
-    print(f"      Root Topic: {root_topic}")
+    _report(f"      Root Topic: {root_topic}")
 
     # Add to device_info
     local_mqtt_info = {
@@ -403,6 +504,92 @@ def _analyze_local_mqtt_config(device: Any, device_info: dict[str, Any]) -> None
     device_info["mqtt_analysis"]["local_mqtt"] = local_mqtt_info
 
 
+def dump_json(data: Any) -> bytes:
+    """Serialize export data as indented JSON, preferring orjson."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
+
+
+def _device_fingerprint(device: Any) -> dict[str, Any]:
+    """Describe a device's configuration without any secret material."""
+    config = device.connected_configuration
+    if not config:
+        return {"firmware_version": None, "credentials_sha256": None}
+
+    blob = config.mqtt.local_broker_credentials or ""
+    return {
+        "firmware_version": config.firmware.version,
+        "credentials_sha256": hashlib.sha256(blob.encode("utf-8")).hexdigest(),
+    }
+
+
+def _has_errors(device_info: dict[str, Any]) -> bool:
+    """Return whether any lookup in a device analysis failed."""
+    config_info = device_info["connected_configuration"]
+    pending_firmware = device_info["pending_firmware"]
+    return (
+        isinstance(device_info["iot_credentials"], _Error)
+        or bool(pending_firmware and pending_firmware.get("error"))
+        or bool(
+            config_info
+            and isinstance(
+                config_info["mqtt"]["local_broker_credentials_decrypted"], _Error
+            )
+        )
+    )
+
+
+def _describe_changes(previous: dict[str, Any], current: dict[str, Any]) -> str:
+    """Summarize how a device's fingerprint differs from the previous run."""
+    if previous["firmware_version"] == current["firmware_version"]:
+        changes = []
+    else:
+        changes = [
+            f"firmware {previous['firmware_version']} → {current['firmware_version']}"
+        ]
+    if previous["credentials_sha256"] != current["credentials_sha256"]:
+        changes.append("local MQTT credentials changed")
+
+    if not changes:
+        return f"♻️  Unchanged since the last clean run ({previous['checked_at']})"
+    return f"🔄 Changed since the last clean run: {', '.join(changes)}"
+
+
+def load_device_cache() -> dict[str, Any]:
+    """Return valid fingerprints by serial number; problems mean no cache."""
+    if not DEVICE_CACHE_ENABLED:
+        return {}
+
+    with suppress(OSError, ValueError, KeyError, TypeError, AttributeError):
+        data = json.loads(DEVICE_CACHE_FILE.read_text(encoding="utf-8"))
+        # Drop malformed entries rather than failing the whole run
+        return {
+            serial: entry
+            for serial, entry in data.items()
+            if isinstance(entry, dict)
+            and {"firmware_version", "credentials_sha256", "checked_at"} <= entry.keys()
+        }
+    return {}
+
+
+def save_device_cache(cache: dict[str, Any]) -> None:
+    """Atomically replace the device cache; failures are ignored."""
+    if not DEVICE_CACHE_ENABLED:
+        return
+
+    tmp_file = DEVICE_CACHE_FILE.with_suffix(".tmp")
+    with suppress(OSError):
+        DEVICE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.unlink(missing_ok=True)
+        # Created private from the start, not chmod-ed after writing
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(dump_json(cache))
+        os.replace(tmp_file, DEVICE_CACHE_FILE)
+
+
 def run_troubleshooting() -> None:
     """Run the complete troubleshooting analysis."""
     # Get credentials
@@ -417,7 +604,12 @@ def run_troubleshooting() -> None:
     try:
         # Initialize client and authenticate (with debug logging enabled)
         with DysonClient(
-            email=email, password=password, country=country, culture=culture, debug=True
+            email=email,
+            password=password,
+            country=country,
+            culture=culture,
+            debug=True,
+            limits=HTTP_LIMITS,
         ) as client:
             # Show regional endpoint information
             from libdyson_rest.utils import get_api_hostname
@@ -467,8 +659,6 @@ def run_troubleshooting() -> None:
         print("\n❌ Analysis cancelled by user")
     except Exception as e:
         print(f"❌ Unexpected error: {type(e).__name__}: {e}")
-        import traceback
-
         traceback.print_exc()
 
 
@@ -529,38 +719,73 @@ def _analyze_all_devices(
     print(f"Found {len(devices)} device(s) on account\n")
 
     troubleshooting_data["summary"]["total_devices"] = len(devices)
+    # One slot per device, filled in device order below
+    device_results: list[Any] = [None] * len(devices)
+    troubleshooting_data["devices"] = device_results
+
+    device_cache = load_device_cache()
+
+    # Fetch IoT credentials for all connected devices concurrently; the
+    # per-device reports below are still printed in order
+    connected = [d for d in devices if d.connection_category.value != "nonConnected"]
+    iot_map: dict[str, Any] = {}
+    if connected:
+        with ThreadPoolExecutor(
+            max_workers=min(IOT_FETCH_WORKERS, len(connected))
+        ) as executor:
+            results = executor.map(
+                lambda d: _safe_get_iot(client, d.serial_number), connected
+            )
+            iot_map = {
+                device.serial_number: result
+                for device, result in zip(connected, results, strict=True)
+            }
 
     for i, device in enumerate(devices, 1):
-        print(f"\n{'─' * 60}")
-        print(f"Device {i} of {len(devices)}")
-        print("─" * 60)
+        print(f"\n{_DEVICE_RULE}\nDevice {i} of {len(devices)}\n{_DEVICE_RULE}")
 
-        device_info = analyze_device_details(device, client)
-        troubleshooting_data["devices"].append(device_info)
+        device_info = analyze_device_details(
+            device, client, iot_map.get(device.serial_number)
+        )
+        device_results[i - 1] = device_info
+
+        fingerprint = _device_fingerprint(device)
+        previous = device_cache.get(device.serial_number)
+        if previous is not None:
+            print(f"\n   {_describe_changes(previous, fingerprint)}")
+
+        # Only clean runs become the baseline for the next comparison
+        if not _has_errors(device_info):
+            fingerprint["checked_at"] = datetime.datetime.now().isoformat(
+                timespec="seconds"
+            )
+            device_cache[device.serial_number] = fingerprint
 
         # Update summary counters
         _update_device_summary(device, device_info, troubleshooting_data["summary"])
 
+    save_device_cache(device_cache)
+
 
 def _update_device_summary(
     device: Any, device_info: dict[str, Any], summary: dict[str, Any]
 ) -> None:
     """Update device summary counters."""
-    if device.connection_category.value != "nonConnected":
+    conn_cat = device.connection_category.value
+    iot_credentials = device_info["iot_credentials"]
+    pending_firmware = device_info["pending_firmware"]
+
+    if conn_cat != "nonConnected":
         summary["connected_devices"] += 1
     if device.connected_configuration:
         summary["devices_with_local_config"] += 1
-    if device_info["iot_credentials"] and not isinstance(
-        device_info["iot_credentials"], str
-    ):
+    if iot_credentials and not isinstance(iot_credentials, _Error):
         summary["devices_with_iot_credentials"] += 1
 
     # Count firmware-related statistics
-    if device_info["pending_firmware"] and device_info["pending_firmware"].get(
-        "available"
-    ):
+    if pending_firmware and pending_firmware.get("available"):
         summary["devices_with_pending_firmware"] += 1
-        if device_info["pending_firmware"].get("pushed"):
+        if pending_firmware.get("pushed"):
             summary["devices_with_pushed_firmware"] += 1
 
 
@@ -568,30 +793,17 @@ def _output_final_summary(troubleshooting_data: dict[str, Any]) -> None:
     """Output the final troubleshooting summary and export data."""
     print_section("TROUBLESHOOTING SUMMARY")
     summary = troubleshooting_data["summary"]
-    print(
-        f"   Authentication: "
-        f"{'✅ SUCCESS' if summary['authentication_successful'] else '❌ FAILED'}"
-    )
-    print(f"   Total Devices: {summary['total_devices']}")
-    print(f"   Connected Devices: {summary['connected_devices']}")
-    print(f"   Devices with Local Config: {summary['devices_with_local_config']}")
-    print(f"   Devices with IoT Credentials: {summary['devices_with_iot_credentials']}")
-    print(
-        f"   Devices with Pending Firmware: {summary['devices_with_pending_firmware']}"
-    )
-    print(f"   Devices with Pushed Firmware: {summary['devices_with_pushed_firmware']}")
+    auth_result = "✅ SUCCESS" if summary["authentication_successful"] else "❌ FAILED"
+    lines = [f"   Authentication: {auth_result}"]
+    lines.extend(f"   {label}: {summary[key]}" for key, label in _SUMMARY_COUNTERS)
+    print("\n".join(lines))
 
-    # Export detailed data
-    import datetime
+    # Export detailed data; the timestamp and filename share one clock reading
+    now = datetime.datetime.now()
+    troubleshooting_data["timestamp"] = now.isoformat()
 
-    troubleshooting_data["timestamp"] = datetime.datetime.now().isoformat()
-
-    filename = (
-        f"dyson_troubleshooting_"
-        f"{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    )
-    with open(filename, "w") as f:
-        json.dump(troubleshooting_data, f, indent=2, default=str)
+    filename = f"dyson_troubleshooting_{now.strftime('%Y%m%d_%H%M%S')}.json"
+    Path(filename).write_bytes(dump_json(troubleshooting_data))
 
     print(f"\n💾 Detailed troubleshooting data exported to: {filename}")
     print("\n🎉 Troubleshooting analysis complete.")
@@ -599,6 +811,24 @@ def _output_final_summary(troubleshooting_data: dict[str, Any]) -> None:
 
 def main() -> None:
     """Main entry point."""
+    global QUIET, DEVICE_CACHE_ENABLED
+
+    parser = argparse.ArgumentParser(description="Troubleshoot a Dyson account")
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="skip the per-device report; details are only written to the JSON file",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="don't compare devices with, or record them for, other runs",
+    )
+    args = parser.parse_args()
+    QUIET = args.quiet
+    if args.no_cache:
+        DEVICE_CACHE_ENABLED = False
+
     try:
         run_troubleshooting()
     except KeyboardInterrupt:
@@ -12,12 +12,21 @@ The Dyson API uses a two-step authentication process:
 import logging
 import os
 
+import httpx
+
 from libdyson_rest import DysonAuthError, DysonClient, DysonConnectionError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by every request a client makes; keeping idle
+# connections for a couple of minutes lets calls made after the OTP prompt
+# reuse the TLS session instead of handshaking again
+HTTP_LIMITS = httpx.Limits(
+    max_connections=16, max_keepalive_connections=4, keepalive_expiry=120
+)
+
 
 def basic_example() -> None:
     """Basic synchronous usage example with two-step authentication."""
@@ -31,6 +40,7 @@ def basic_example() -> None:
         country="US",  # 2-letter ISO country code (determines API endpoint)
         culture="en-US",  # Language/locale code
         timeout=30,
+        limits=HTTP_LIMITS,  # Optional: tune the keep-alive connection pool
     )
 
     try:
@@ -48,37 +58,37 @@ def basic_example() -> None:
 
         # Begin the login process to get a challenge
         challenge = client.begin_login()
-        logger.info(f"Challenge ID received: {challenge.challenge_id}")
+        logger.info("Challenge ID received: %s", challenge.challenge_id)
 
         # Complete authentication with OTP code
         login_info = client.complete_login(str(challenge.challenge_id), otp_code)
-        logger.info(f"Authentication successful! Account: {login_info.account}")
+        logger.info("Authentication successful! Account: %s", login_info.account)
 
         # Get list of devices
         logger.info("Retrieving device list...")
         devices = client.get_devices()
 
-        logger.info(f"Found {len(devices)} devices:")
+        logger.info("Found %s devices:", len(devices))
         for device in devices:
-            logger.info(f"  - {device.name} ({device.serial_number})")
-            logger.info(f"    Type: {device.type}, Model: {device.model}")
-            logger.info(f"    Category: {device.category.value}")
-            logger.info(f"    Connection: {device.connection_category.value}")
+            logger.info("  - %s (%s)", device.name, device.serial_number)
+            logger.info("    Type: %s, Model: %s", device.type, device.model)
+            logger.info("    Category: %s", device.category.value)
+            logger.info("    Connection: %s", device.connection_category.value)
 
             # Get IoT credentials for this device (if connected)
             if device.connection_category.value != "nonConnected":
                 try:
                     iot_data = client.get_iot_credentials(device.serial_number)
-                    logger.info(f"    IoT Endpoint: {iot_data.endpoint}")
+                    logger.info("    IoT Endpoint: %s", iot_data.endpoint)
                 except Exception as e:
-                    logger.warning(f"    Could not get IoT credentials: {e}")
+                    logger.warning("    Could not get IoT credentials: %s", e)
 
     except DysonAuthError as e:
-        logger.error(f"Authentication error: {e}")
+        logger.error("Authentication error: %s", e)
     except DysonConnectionError as e:
-        logger.error(f"Connection error: {e}")
+        logger.error("Connection error: %s", e)
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
     finally:
         # Always close the client
         client.close()
@@ -100,22 +110,22 @@ def context_manager_example() -> None:
 
             # Provision API access (this is required first)
             version = client.provision()
-            logger.info(f"API provisioned, version: {version}")
+            logger.info("API provisioned, version: %s", version)
 
             # Check user status
             user_status = client.get_user_status()
-            logger.info(f"Account status: {user_status.account_status.value}")
-            logger.info(f"Auth method: {user_status.authentication_method.value}")
+            logger.info("Account status: %s", user_status.account_status.value)
+            logger.info("Auth method: %s", user_status.authentication_method.value)
 
             # Begin login process
             challenge = client.begin_login()
-            logger.info(f"Login challenge ID: {challenge.challenge_id}")
+            logger.info("Login challenge ID: %s", challenge.challenge_id)
 
             # In a real application, you would get the OTP from user input
             logger.info("OTP code would be required to complete authentication")
 
     except Exception as e:
-        logger.error(f"Error in context manager example: {e}")
+        logger.error("Error in context manager example: %s", e)
 
 
 def step_by_step_auth_example() -> None:
@@ -126,6 +136,7 @@ def step_by_step_auth_example() -> None:
         country=os.getenv("DYSON_COUNTRY", "US"),
         culture=os.getenv("DYSON_CULTURE", "en-US"),
         timeout=int(os.getenv("DYSON_TIMEOUT", "30")),
+        limits=HTTP_LIMITS,
     )
 
     try:
@@ -134,20 +145,20 @@ def step_by_step_auth_example() -> None:
         # Step 1: Provision API access (required)
         logger.info("Step 1: Provisioning API access...")
         version = client.provision()
-        logger.info(f"✓ API provisioned successfully, version: {version}")
+        logger.info("✓ API provisioned successfully, version: %s", version)
 
         # Step 2: Check user account status
         logger.info("\\nStep 2: Checking user account status...")
         user_status = client.get_user_status()
-        logger.info(f"✓ Account Status: {user_status.account_status.value}")
+        logger.info("✓ Account Status: %s", user_status.account_status.value)
         logger.info(
-            f"✓ Authentication Method: {user_status.authentication_method.value}"
+            "✓ Authentication Method: %s", user_status.authentication_method.value
         )
 
         # Step 3: Begin login process
         logger.info("\\nStep 3: Beginning login process...")
         challenge = client.begin_login()
-        logger.info(f"✓ Challenge ID received: {challenge.challenge_id}")
+        logger.info("✓ Challenge ID received: %s", challenge.challenge_id)
         logger.info("📧 OTP code should now be sent to your email")
 
         # Step 4: Complete login with OTP (in real use, get from user input)
@@ -163,7 +174,9 @@ def step_by_step_auth_example() -> None:
         # For demo purposes, show what the login completion would look like
         demo_otp = "123456"  # This would come from user input
         logger.info(
-            f"\\nDemo: client.complete_login('{challenge.challenge_id}', '{demo_otp}')"
+            "\\nDemo: client.complete_login('%s', '%s')",
+            challenge.challenge_id,
+            demo_otp,
         )
         logger.info("This would complete authentication and return login information")
 
@@ -172,7 +185,7 @@ def step_by_step_auth_example() -> None:
     except DysonConnectionError:
         logger.error("Connection failed. Please check your internet connection.")
     except Exception as e:
-        logger.error(f"Unexpected error: {type(e).__name__}: {e}")
+        logger.error("Unexpected error: %s: %s", type(e).__name__, e)
     finally:
         client.close()
 
@@ -220,7 +233,7 @@ def regional_endpoint_example() -> None:
     ]
 
     for country_code, country_name, endpoint in regional_examples:
-        logger.info(f"{country_code} ({country_name}): {endpoint}")
+        logger.info("%s (%s): %s", country_code, country_name, endpoint)
 
     logger.info("\nExample clients for different regions:")
 
@@ -233,7 +246,7 @@ def regional_endpoint_example() -> None:
         culture="en-AU",
         timeout=30,
     )
-    logger.info(f"AU client configured for region: {aus_client.country}")
+    logger.info("AU client configured for region: %s", aus_client.country)
     aus_client.close()
 
     # New Zealand client
@@ -245,7 +258,7 @@ def regional_endpoint_example() -> None:
         culture="en-NZ",
         timeout=30,
     )
-    logger.info(f"NZ client configured for region: {nz_client.country}")
+    logger.info("NZ client configured for region: %s", nz_client.country)
     nz_client.close()
 
     # Chinese client
@@ -257,7 +270,7 @@ def regional_endpoint_example() -> None:
         culture="zh-CN",
         timeout=30,
     )
-    logger.info(f"CN client configured for region: {cn_client.country}")
+    logger.info("CN client configured for region: %s", cn_client.country)
     cn_client.close()
 
     # Default/fallback example
@@ -269,7 +282,7 @@ def regional_endpoint_example() -> None:
         culture="en-US",
         timeout=30,
     )
-    logger.info(f"Default client configured for region: {default_client.country}")
+    logger.info("Default client configured for region: %s", default_client.country)
     default_client.close()
 
     logger.info(
@@ -8,14 +8,28 @@ This script validates that both sync and async clients work correctly.
 import asyncio
 import sys
 
+try:
+    import libdyson_rest as dyson
+    from libdyson_rest import DysonAPIError, DysonAuthError, DysonClient
+except ImportError as e:  # Reported as a failure by main
+    _IMPORT_ERROR: ImportError | None = e
+else:
+    _IMPORT_ERROR = None
+
+try:
+    from libdyson_rest import AsyncDysonClient
+except ImportError as e:  # Reported as skipped by test_async_client
+    AsyncDysonClient = None
+    _ASYNC_IMPORT_ERROR: ImportError | None = e
+else:
+    _ASYNC_IMPORT_ERROR = None
+
 
 def test_sync_client():
     """Test that the sync client imports and initializes correctly."""
     print("🔄 Testing sync client...")
 
     try:
-        from libdyson_rest import DysonClient
-
         # Test basic initialization
         client = DysonClient()
         assert client.country == "US"
@@ -54,9 +68,11 @@ async def test_async_client():
     """Test that the async client imports and works correctly."""
     print("🔄 Testing async client...")
 
-    try:
-        from libdyson_rest import AsyncDysonClient
+    if AsyncDysonClient is None:
+        print(f"⚠️  Async client not available (missing httpx): {_ASYNC_IMPORT_ERROR}")
+        return None  # Not a failure, just not available
 
+    try:
         # Test basic initialization
         client = AsyncDysonClient()
         assert client.country == "US"
@@ -87,9 +103,6 @@ async def test_async_client():
         print("✅ Async client tests passed")
         return True
 
-    except ImportError as e:
-        print(f"⚠️  Async client not available (missing httpx): {e}")
-        return None  # Not a failure, just not available
     except Exception as e:
         print(f"❌ Async client test failed: {e}")
         return False
@@ -100,8 +113,6 @@ def test_exports():
     print("🔄 Testing module exports...")
 
     try:
-        import libdyson_rest as dyson
-
         # Test that sync client is always available
         assert hasattr(dyson, "DysonClient")
         assert hasattr(dyson, "DysonAPIError")
@@ -129,8 +140,6 @@ def test_error_handling():
     print("🔄 Testing error handling...")
 
     try:
-        from libdyson_rest import DysonAPIError, DysonAuthError, DysonClient
-
         # Test that errors are raised correctly
         client = DysonClient()
 
@@ -167,6 +176,10 @@ async def main():
     print("🌟 Starting libdyson-rest validation tests")
     print("=" * 50)
 
+    if _IMPORT_ERROR is not None:
+        print(f"❌ Could not import libdyson_rest: {_IMPORT_ERROR}")
+        return 1
+
     tests = [
         ("Sync Client", test_sync_client, False),
         ("Async Client", test_async_client, True),
@@ -174,21 +187,27 @@ async def main():
         ("Error Handling", test_error_handling, False),
     ]
 
-    results = []
+    print(f"\n📋 Running {len(tests)} tests concurrently")
+    print("-" * 30)
 
-    for name, test_func, is_async in tests:
-        print(f"\n📋 Running: {name}")
-        print("-" * 30)
+    # The tests share no state, so the sync ones run in worker threads
+    # alongside the async one
+    loop = asyncio.get_running_loop()
+    outcomes = await asyncio.gather(
+        *(
+            test_func() if is_async else loop.run_in_executor(None, test_func)
+            for _, test_func, is_async in tests
+        ),
+        return_exceptions=True,
+    )
 
-        try:
-            if is_async:
-                result = await test_func()
-            else:
-                result = test_func()
-            results.append((name, result))
-        except Exception as e:
-            print(f"❌ Test {name} crashed: {e}")
+    results = []
+    for (name, _, _), outcome in zip(tests, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            print(f"❌ Test {name} crashed: {outcome}")
             results.append((name, False))
+        else:
+            results.append((name, outcome))
 
     print("\n📊 Results Summary")
     print("=" * 50)
@@ -6,37 +6,53 @@ This script demonstrates that the libdyson-rest library now has comprehensive
 type checking and will catch common type-related errors at development time.
 """
 
+import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Absolute path of the running interpreter, so commands need no PATH lookup
+# and work with any virtualenv layout (not only Windows' .venv/Scripts)
+PYTHON = sys.executable
 
-def run_command(cmd: list[str], description: str) -> bool:
-    """Run a command and report results."""
+
+def execute(cmd: list[str]) -> subprocess.CompletedProcess[str] | Exception:
+    """Run a command, returning the exception instead of raising it."""
+    try:
+        # Commands are relative to the project root, which main() makes the
+        # working directory. Leaving cwd unset and not closing fds
+        # lets CPython launch via posix_spawn rather than fork+exec on Linux
+        return subprocess.run(cmd, capture_output=True, text=True, close_fds=False)
+    except Exception as e:
+        return e
+
+
+def report_result(
+    cmd: list[str],
+    description: str,
+    result: subprocess.CompletedProcess[str] | Exception,
+) -> bool:
+    """Report the outcome of a command that has already run."""
     print(f"\n🔍 {description}")
     print(f"Command: {' '.join(cmd)}")
     print("-" * 60)
 
-    try:
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, cwd=Path(__file__).parent
-        )
-
-        if result.returncode == 0:
-            print("✅ PASSED")
-            if result.stdout:
-                print(result.stdout)
-            return True
-        else:
-            print("❌ FAILED")
-            if result.stderr:
-                print("STDERR:", result.stderr)
-            if result.stdout:
-                print("STDOUT:", result.stdout)
-            return False
+    if isinstance(result, Exception):
+        print(f"❌ ERROR: {result}")
+        return False
 
-    except Exception as e:
-        print(f"❌ ERROR: {e}")
+    if result.returncode == 0:
+        print("✅ PASSED")
+        if result.stdout:
+            print(result.stdout)
+        return True
+    else:
+        print("❌ FAILED")
+        if result.stderr:
+            print("STDERR:", result.stderr)
+        if result.stdout:
+            print("STDOUT:", result.stdout)
         return False
 
 
@@ -45,20 +61,26 @@ def main() -> None:
     print("🚀 Verifying Strict Type Checking Implementation")
     print("=" * 60)
 
-    # Check if we're in the right directory
-    if not Path("pyproject.toml").exists():
-        print("❌ ERROR: Must run from project root directory")
+    # Run from the project root: the nearest directory at or above the
+    # working directory that holds pyproject.toml
+    cwd = Path.cwd()
+    for candidate in (cwd, *cwd.parents):
+        if (candidate / "pyproject.toml").is_file():
+            os.chdir(candidate)
+            break
+    else:
+        print("❌ ERROR: Must run from within the project directory")
         sys.exit(1)
 
     # Tests to run
     tests = [
         {
-            "cmd": [".venv/Scripts/python.exe", "-m", "mypy", "src/libdyson_rest"],
+            "cmd": [PYTHON, "-m", "mypy", "src/libdyson_rest"],
             "description": "Basic mypy type checking",
         },
         {
             "cmd": [
-                ".venv/Scripts/python.exe",
+                PYTHON,
                 "-m",
                 "mypy",
                 "src/libdyson_rest",
@@ -67,23 +89,28 @@ def main() -> None:
             "description": "Strict mypy type checking",
         },
         {
-            "cmd": [".venv/Scripts/python.exe", "-m", "pytest", "-v"],
+            "cmd": [PYTHON, "-m", "pytest", "-v"],
             "description": "Unit and integration tests",
         },
         {
-            "cmd": [".venv/Scripts/python.exe", "-m", "flake8", "."],
+            "cmd": [PYTHON, "-m", "flake8", "."],
             "description": "Code style linting",
         },
         {
-            "cmd": [".venv/Scripts/python.exe", "-m", "black", "--check", "."],
+            "cmd": [PYTHON, "-m", "black", "--check", "."],
             "description": "Code formatting check",
         },
     ]
 
-    results = []
-    for test in tests:
-        success = run_command(test["cmd"], test["description"])
-        results.append(success)
+    # The checks are independent subprocesses, so run them all at once and
+    # report in the original order once they have finished
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        outcomes = list(executor.map(lambda test: execute(test["cmd"]), tests))
+
+    results = [
+        report_result(test["cmd"], test["description"], outcome)
+        for test, outcome in zip(tests, outcomes, strict=True)
+    ]
 
     # Summary
     print("\n" + "=" * 60)
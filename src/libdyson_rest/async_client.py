@@ -46,7 +46,7 @@ from .types import (
     ScheduledEventsDataDict,
     UserStatusResponseDict,
 )
-from .utils import get_api_hostname
+from .utils import get_api_hostname, get_environment_proxy
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +56,10 @@ logger = logging.getLogger(__name__)
 # added header, and Darwin is the iOS version as of 18.6.2
 DEFAULT_USER_AGENT = "android client"
 
+# Times a failed TCP/TLS connection attempt is retried. Nothing has been sent
+# at that point, so retrying is safe for POST requests as well
+CONNECT_RETRIES = 2
+
 
 class AsyncDysonClient:
     """
@@ -96,6 +100,7 @@ class AsyncDysonClient:
         timeout: int = 30,
         user_agent: str = DEFAULT_USER_AGENT,
         debug: bool = False,
+        limits: httpx.Limits | None = None,
     ) -> None:
         """
         Initialize the async Dyson client.
@@ -109,6 +114,8 @@ class AsyncDysonClient:
             timeout: Request timeout in seconds
             user_agent: User agent string for requests
             debug: Enable detailed debug logging (includes HTTP requests/responses)
+            limits: Connection pool limits for the underlying HTTP client
+                (httpx defaults are used if not provided)
 
         Raises:
             ValueError: If country or culture format is invalid
@@ -136,6 +143,7 @@ class AsyncDysonClient:
         self.timeout = timeout
         self.user_agent = user_agent
         self.debug = debug
+        self.limits = limits
 
         # Build headers
         headers = {"User-Agent": user_agent}
@@ -163,6 +171,19 @@ class AsyncDysonClient:
         # Enable debug logging for httpx
         logging.getLogger("httpx").setLevel(logging.DEBUG)
 
+    def _require_auth(self, action: str) -> None:
+        """
+        Raise before any request is made if no bearer token is set.
+
+        Args:
+            action: What the caller is about to do, used in the error message
+
+        Raises:
+            DysonAuthError: If the client has not authenticated
+        """
+        if not self._auth_token:
+            raise DysonAuthError(f"Must authenticate before {action}")
+
     async def _get_client(self) -> httpx.AsyncClient:
         """
         Get or create the async HTTP client.
@@ -175,9 +196,22 @@ class AsyncDysonClient:
             import asyncio
 
             def create_client() -> httpx.AsyncClient:
+                # Only override httpx's default pool limits when configured.
+                # With an explicit transport, limits and any proxy belong to
+                # the transport, and httpx no longer reads environment proxies
+                pool_options: dict[str, Any] = {}
+                if self.limits is not None:
+                    pool_options["limits"] = self.limits
+                proxy_url = get_environment_proxy(get_api_hostname(self.country))
+                if proxy_url:
+                    pool_options["proxy"] = httpx.Proxy(proxy_url)
+                transport = httpx.AsyncHTTPTransport(
+                    retries=CONNECT_RETRIES, **pool_options
+                )
                 return httpx.AsyncClient(
                     headers=self._base_headers.copy(),
                     timeout=self.timeout,
+                    transport=transport,
                 )
 
             # Run the potentially blocking client creation in a thread pool
@@ -725,8 +759,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails
             DysonAPIError: If API request fails
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before getting devices")
+        self._require_auth("getting devices")
 
         url = urljoin(get_api_hostname(self.country), "/v3/manifest")
 
@@ -769,8 +802,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails
             DysonAPIError: If API request fails
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before getting IoT credentials")
+        self._require_auth("getting IoT credentials")
 
         url = urljoin(get_api_hostname(self.country), "/v2/authorize/iot-credentials")
         payload = {"Serial": serial_number}
@@ -809,10 +841,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails
             DysonAPIError: If API request fails
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before getting pending release info"
-            )
+        self._require_auth("getting pending release info")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -856,8 +885,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails
             DysonAPIError: If API request fails
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before triggering firmware update")
+        self._require_auth("triggering firmware update")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1106,8 +1134,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_clean_maps")
+        self._require_auth("calling get_clean_maps")
 
         url = urljoin(get_api_hostname(self.country), f"/v2/{serial_number}/clean-maps")
         params: dict[str, str] = {}
@@ -1161,10 +1188,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_persistent_map_metadata"
-            )
+        self._require_auth("calling get_persistent_map_metadata")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1219,8 +1243,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_persistent_map")
+        self._require_auth("calling get_persistent_map")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1265,10 +1288,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_recommended_cleans"
-            )
+        self._require_auth("calling get_recommended_cleans")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1332,8 +1352,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling set_zone_behaviour")
+        self._require_auth("calling set_zone_behaviour")
 
         strategy_value = (
             strategy.value if isinstance(strategy, CleaningStrategy) else str(strategy)
@@ -1375,10 +1394,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_daily_environment_data"
-            )
+        self._require_auth("calling get_daily_environment_data")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1425,10 +1441,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_scheduled_events"
-            )
+        self._require_auth("calling get_scheduled_events")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1474,10 +1487,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_outdoor_environment_data"
-            )
+        self._require_auth("calling get_outdoor_environment_data")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1533,8 +1543,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_clean_map_data")
+        self._require_auth("calling get_clean_map_data")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1575,10 +1584,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling update_persistent_map"
-            )
+        self._require_auth("calling update_persistent_map")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1611,10 +1617,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling delete_persistent_map"
-            )
+        self._require_auth("calling delete_persistent_map")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1650,8 +1653,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling update_map_metadata")
+        self._require_auth("calling update_map_metadata")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1693,10 +1695,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_clean_estimation"
-            )
+        self._require_auth("calling get_clean_estimation")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1740,8 +1739,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_restrictions")
+        self._require_auth("calling get_restrictions")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1786,8 +1784,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling update_restrictions")
+        self._require_auth("calling update_restrictions")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1820,8 +1817,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling divide_zone")
+        self._require_auth("calling divide_zone")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1854,8 +1850,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling merge_zones")
+        self._require_auth("calling merge_zones")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1890,10 +1885,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_live_map_cleaning"
-            )
+        self._require_auth("calling get_live_map_cleaning")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1936,10 +1928,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_live_map_mapping"
-            )
+        self._require_auth("calling get_live_map_mapping")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1986,10 +1975,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling set_scheduled_events"
-            )
+        self._require_auth("calling set_scheduled_events")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2028,8 +2014,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_schedule_binary")
+        self._require_auth("calling get_schedule_binary")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2075,8 +2060,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_map_image")
+        self._require_auth("calling get_map_image")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2114,8 +2098,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_timezone")
+        self._require_auth("calling get_timezone")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2153,8 +2136,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling set_timezone")
+        self._require_auth("calling set_timezone")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2186,8 +2168,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_ota_info")
+        self._require_auth("calling get_ota_info")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2229,8 +2210,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling is_banned_machine")
+        self._require_auth("calling is_banned_machine")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2272,8 +2252,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_feature_support")
+        self._require_auth("calling get_feature_support")
 
         url = urljoin(get_api_hostname(self.country), "/v1/featuresupport")
 
@@ -2310,8 +2289,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_voice_languages")
+        self._require_auth("calling get_voice_languages")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2362,10 +2340,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_environment_history"
-            )
+        self._require_auth("calling get_environment_history")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2414,8 +2389,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_energy_insights")
+        self._require_auth("calling get_energy_insights")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2464,8 +2438,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_product_faults")
+        self._require_auth("calling get_product_faults")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2505,8 +2478,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_product_guide")
+        self._require_auth("calling get_product_guide")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2546,10 +2518,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_product_voice_commands"
-            )
+        self._require_auth("calling get_product_voice_commands")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2606,8 +2575,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling register_push_token")
+        self._require_auth("calling register_push_token")
 
         url = urljoin(get_api_hostname(self.country), "/v1/notifier/applications")
         body: dict[str, Any] = {
@@ -2656,10 +2624,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_notification_permissions"
-            )
+        self._require_auth("calling get_notification_permissions")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2709,10 +2674,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling update_notification_permissions"
-            )
+        self._require_auth("calling update_notification_permissions")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2750,10 +2712,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_registered_products"
-            )
+        self._require_auth("calling get_registered_products")
 
         url = urljoin(get_api_hostname(self.country), "/v1/ncp/product/registered")
 
@@ -2787,8 +2746,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling register_ncp")
+        self._require_auth("calling register_ncp")
 
         url = urljoin(get_api_hostname(self.country), "/v1/ncp/register")
 
@@ -2814,8 +2772,7 @@ class AsyncDysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling register_nsp")
+        self._require_auth("calling register_nsp")
 
         url = urljoin(get_api_hostname(self.country), "/v1/nsp/register")
 
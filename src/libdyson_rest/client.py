@@ -47,7 +47,7 @@ from .types import (
     ScheduledEventsDataDict,
     UserStatusResponseDict,
 )
-from .utils import get_api_hostname
+from .utils import get_api_hostname, get_environment_proxy
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +57,10 @@ logger = logging.getLogger(__name__)
 # added header, and Darwin is the iOS version as of 18.6.2
 DEFAULT_USER_AGENT = "android client"
 
+# Times a failed TCP/TLS connection attempt is retried. Nothing has been sent
+# at that point, so retrying is safe for POST requests as well
+CONNECT_RETRIES = 2
+
 
 class DysonClient:
     """
@@ -95,6 +99,7 @@ class DysonClient:
         timeout: int = 30,
         user_agent: str = DEFAULT_USER_AGENT,
         debug: bool = False,
+        limits: httpx.Limits | None = None,
     ) -> None:
         """
         Initialize the Dyson client.
@@ -108,6 +113,8 @@ class DysonClient:
             timeout: Request timeout in seconds
             user_agent: User agent string for requests
             debug: Enable detailed debug logging (includes HTTP requests/responses)
+            limits: Connection pool limits for the underlying HTTP client
+                (httpx defaults are used if not provided)
 
         Raises:
             ValueError: If country or culture format is invalid
@@ -135,8 +142,21 @@ class DysonClient:
         self.timeout = timeout
         self.user_agent = user_agent
         self.debug = debug
-
-        self.session = httpx.Client(headers={"User-Agent": user_agent})
+        self.limits = limits
+
+        # Only override httpx's default pool limits when configured. With an
+        # explicit transport, limits and any proxy belong to the transport, and
+        # httpx no longer reads proxies from the environment itself
+        pool_options: dict[str, Any] = {}
+        if limits is not None:
+            pool_options["limits"] = limits
+        proxy_url = get_environment_proxy(get_api_hostname(country))
+        if proxy_url:
+            pool_options["proxy"] = httpx.Proxy(proxy_url)
+        transport = httpx.HTTPTransport(retries=CONNECT_RETRIES, **pool_options)
+        self.session = httpx.Client(
+            headers={"User-Agent": user_agent}, transport=transport
+        )
 
         # Configure debug logging if enabled
         if debug:
@@ -157,6 +177,19 @@ class DysonClient:
         # Enable debug logging for httpx
         logging.getLogger("httpx").setLevel(logging.DEBUG)
 
+    def _require_auth(self, action: str) -> None:
+        """
+        Raise before any request is made if no bearer token is set.
+
+        Args:
+            action: What the caller is about to do, used in the error message
+
+        Raises:
+            DysonAuthError: If the client has not authenticated
+        """
+        if not self._auth_token:
+            raise DysonAuthError(f"Must authenticate before {action}")
+
     def provision(self) -> str:
         """
         Make the required provisioning call to the API.
@@ -711,8 +744,7 @@ class DysonClient:
             DysonConnectionError: If connection fails
             DysonAPIError: If API request fails
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before getting devices")
+        self._require_auth("getting devices")
 
         url = urljoin(get_api_hostname(self.country), "/v3/manifest")
 
@@ -756,8 +788,7 @@ class DysonClient:
             DysonConnectionError: If connection fails
             DysonAPIError: If API request fails
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before getting IoT credentials")
+        self._require_auth("getting IoT credentials")
 
         url = urljoin(get_api_hostname(self.country), "/v2/authorize/iot-credentials")
         payload = {"Serial": serial_number}
@@ -797,10 +828,7 @@ class DysonClient:
             DysonConnectionError: If connection fails
             DysonAPIError: If API request fails
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before getting pending release info"
-            )
+        self._require_auth("getting pending release info")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -845,8 +873,7 @@ class DysonClient:
             DysonConnectionError: If connection fails
             DysonAPIError: If API request fails
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before triggering firmware update")
+        self._require_auth("triggering firmware update")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1089,8 +1116,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_clean_maps")
+        self._require_auth("calling get_clean_maps")
 
         url = urljoin(get_api_hostname(self.country), f"/v2/{serial_number}/clean-maps")
         params: dict[str, str] = {}
@@ -1145,10 +1171,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_persistent_map_metadata"
-            )
+        self._require_auth("calling get_persistent_map_metadata")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1202,8 +1225,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_persistent_map")
+        self._require_auth("calling get_persistent_map")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1247,10 +1269,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_recommended_cleans"
-            )
+        self._require_auth("calling get_recommended_cleans")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1315,8 +1334,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling set_zone_behaviour")
+        self._require_auth("calling set_zone_behaviour")
 
         strategy_value = (
             strategy.value if isinstance(strategy, CleaningStrategy) else str(strategy)
@@ -1363,10 +1381,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_daily_environment_data"
-            )
+        self._require_auth("calling get_daily_environment_data")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1414,10 +1429,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_scheduled_events"
-            )
+        self._require_auth("calling get_scheduled_events")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1464,10 +1476,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_outdoor_environment_data"
-            )
+        self._require_auth("calling get_outdoor_environment_data")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1522,8 +1531,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_clean_map_data")
+        self._require_auth("calling get_clean_map_data")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1565,10 +1573,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling update_persistent_map"
-            )
+        self._require_auth("calling update_persistent_map")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1602,10 +1607,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling delete_persistent_map"
-            )
+        self._require_auth("calling delete_persistent_map")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1642,8 +1644,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling update_map_metadata")
+        self._require_auth("calling update_map_metadata")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1686,10 +1687,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_clean_estimation"
-            )
+        self._require_auth("calling get_clean_estimation")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1734,8 +1732,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_restrictions")
+        self._require_auth("calling get_restrictions")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1781,8 +1778,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling update_restrictions")
+        self._require_auth("calling update_restrictions")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1816,8 +1812,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling divide_zone")
+        self._require_auth("calling divide_zone")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1851,8 +1846,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling merge_zones")
+        self._require_auth("calling merge_zones")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1888,10 +1882,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_live_map_cleaning"
-            )
+        self._require_auth("calling get_live_map_cleaning")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1935,10 +1926,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_live_map_mapping"
-            )
+        self._require_auth("calling get_live_map_mapping")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -1986,10 +1974,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling set_scheduled_events"
-            )
+        self._require_auth("calling set_scheduled_events")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2031,8 +2016,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_schedule_binary")
+        self._require_auth("calling get_schedule_binary")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2079,8 +2063,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_map_image")
+        self._require_auth("calling get_map_image")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2119,8 +2102,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_timezone")
+        self._require_auth("calling get_timezone")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2159,8 +2141,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling set_timezone")
+        self._require_auth("calling set_timezone")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2195,8 +2176,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_ota_info")
+        self._require_auth("calling get_ota_info")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2239,8 +2219,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling is_banned_machine")
+        self._require_auth("calling is_banned_machine")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2283,8 +2262,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_feature_support")
+        self._require_auth("calling get_feature_support")
 
         url = urljoin(get_api_hostname(self.country), "/v1/featuresupport")
 
@@ -2322,8 +2300,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_voice_languages")
+        self._require_auth("calling get_voice_languages")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2375,10 +2352,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_environment_history"
-            )
+        self._require_auth("calling get_environment_history")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2428,8 +2402,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_energy_insights")
+        self._require_auth("calling get_energy_insights")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2479,8 +2452,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_product_faults")
+        self._require_auth("calling get_product_faults")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2521,8 +2493,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling get_product_guide")
+        self._require_auth("calling get_product_guide")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2563,10 +2534,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_product_voice_commands"
-            )
+        self._require_auth("calling get_product_voice_commands")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2624,8 +2592,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling register_push_token")
+        self._require_auth("calling register_push_token")
 
         url = urljoin(get_api_hostname(self.country), "/v1/notifier/applications")
         body: dict[str, Any] = {
@@ -2675,10 +2642,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_notification_permissions"
-            )
+        self._require_auth("calling get_notification_permissions")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2729,10 +2693,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling update_notification_permissions"
-            )
+        self._require_auth("calling update_notification_permissions")
 
         url = urljoin(
             get_api_hostname(self.country),
@@ -2769,10 +2730,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError(
-                "Must authenticate before calling get_registered_products"
-            )
+        self._require_auth("calling get_registered_products")
 
         url = urljoin(get_api_hostname(self.country), "/v1/ncp/product/registered")
 
@@ -2807,8 +2765,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling register_ncp")
+        self._require_auth("calling register_ncp")
 
         url = urljoin(get_api_hostname(self.country), "/v1/ncp/register")
 
@@ -2835,8 +2792,7 @@ class DysonClient:
             DysonConnectionError: If connection fails.
             DysonAPIError: If API request fails.
         """
-        if not self._auth_token:
-            raise DysonAuthError("Must authenticate before calling register_nsp")
+        self._require_auth("calling register_nsp")
 
         url = urljoin(get_api_hostname(self.country), "/v1/nsp/register")
 
@@ -4,7 +4,11 @@ import base64
 import hashlib
 import json
 import re
+import urllib.request
 from typing import Any
+from urllib.parse import urlsplit
+
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
 
 def validate_email(email: str) -> bool:
@@ -17,8 +21,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if email format is valid, False otherwise
     """
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def hash_password(password: str) -> str:
@@ -110,3 +113,30 @@ def get_api_hostname(country: str) -> str:
 
     # Return regional endpoint if available, otherwise default to .com
     return regional_endpoints.get(country, "https://appapi.cp.dyson.com")
+
+
+def get_environment_proxy(url: str) -> str | None:
+    """
+    Find the proxy configured in the environment for a URL.
+
+    Mirrors how httpx reads ``HTTPS_PROXY``/``HTTP_PROXY``/``ALL_PROXY`` and
+    ``NO_PROXY``, for clients that pass their own transport (httpx ignores
+    environment proxies in that case).
+
+    Args:
+        url: Request URL, e.g. the result of get_api_hostname()
+
+    Returns:
+        The proxy URL to use, or None if the URL should be reached directly
+    """
+    parts = urlsplit(url)
+    if urllib.request.proxy_bypass_environment(parts.hostname or ""):
+        return None
+
+    proxies = urllib.request.getproxies_environment()
+    proxy_url = proxies.get(parts.scheme) or proxies.get("all")
+    if not proxy_url:
+        return None
+
+    # httpx treats a bare "host:port" as an http:// proxy
+    return proxy_url if "://" in proxy_url else f"http://{proxy_url}"
@@ -10,21 +10,25 @@ import sys
 from libdyson_rest import AsyncDysonClient
 from libdyson_rest.utils import get_api_hostname
 
-# Setup debug logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    stream=sys.stdout,
-)
 
-# Enable debug logging for our library
-logging.getLogger("libdyson_rest").setLevel(logging.DEBUG)
-logging.getLogger("httpx").setLevel(logging.DEBUG)
-logging.getLogger("requests").setLevel(logging.DEBUG)
+def setup_debug_logging() -> None:
+    """Configure debug logging; done on first run rather than at import."""
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        stream=sys.stdout,
+    )
+
+    # Enable debug logging for our library
+    logging.getLogger("libdyson_rest").setLevel(logging.DEBUG)
+    logging.getLogger("httpx").setLevel(logging.DEBUG)
+    logging.getLogger("requests").setLevel(logging.DEBUG)
 
 
 async def test_debug_logging() -> None:
     """Test that debug logging is working properly."""
+    setup_debug_logging()
+
     print("🔍 Testing Debug Logging")
     print("=" * 50)
 
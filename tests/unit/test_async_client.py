@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import httpx
 import pytest
 
-from libdyson_rest.async_client import AsyncDysonClient
+from libdyson_rest.async_client import CONNECT_RETRIES, AsyncDysonClient
 from libdyson_rest.exceptions import DysonAPIError, DysonAuthError, DysonConnectionError
 
 
@@ -44,6 +44,40 @@ class TestAsyncDysonClient:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_client_uses_custom_connection_limits(self) -> None:
+        """Test custom connection pool limits are passed to the HTTP client."""
+        limits = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        client = AsyncDysonClient(limits=limits)
+
+        assert client.limits is limits
+        with (
+            patch("libdyson_rest.async_client.httpx.AsyncClient"),
+            patch(
+                "libdyson_rest.async_client.httpx.AsyncHTTPTransport"
+            ) as mock_transport,
+        ):
+            await client._get_client()
+
+        assert mock_transport.call_args.kwargs["limits"] is limits
+        assert mock_transport.call_args.kwargs["retries"] == CONNECT_RETRIES
+
+    @pytest.mark.asyncio
+    async def test_client_uses_default_connection_limits(self) -> None:
+        """Test httpx default pool limits are kept when none are provided."""
+        client = AsyncDysonClient()
+
+        assert client.limits is None
+        with (
+            patch("libdyson_rest.async_client.httpx.AsyncClient"),
+            patch(
+                "libdyson_rest.async_client.httpx.AsyncHTTPTransport"
+            ) as mock_transport,
+        ):
+            await client._get_client()
+
+        assert "limits" not in mock_transport.call_args.kwargs
+
     @pytest.mark.asyncio
     async def test_authentication_no_credentials(self) -> None:
         """Test authentication fails without credentials."""
@@ -5,7 +5,7 @@ from unittest.mock import Mock, patch
 import httpx
 import pytest
 
-from libdyson_rest.client import DysonClient
+from libdyson_rest.client import CONNECT_RETRIES, DysonClient
 from libdyson_rest.exceptions import DysonAPIError, DysonAuthError, DysonConnectionError
 
 
@@ -303,6 +303,61 @@ class TestDysonClient:
 
         client.close()
 
+    def test_client_uses_custom_connection_limits(self) -> None:
+        """Test custom connection pool limits are passed to the HTTP client."""
+        limits = httpx.Limits(max_connections=20, keepalive_expiry=60)
+        with (
+            patch("libdyson_rest.client.httpx.HTTPTransport") as mock_transport,
+            DysonClient(limits=limits) as client,
+        ):
+            assert client.limits is limits
+            assert mock_transport.call_args.kwargs["limits"] is limits
+
+    def test_client_uses_default_connection_limits(self) -> None:
+        """Test httpx default pool limits are kept when none are provided."""
+        with (
+            patch("libdyson_rest.client.httpx.HTTPTransport") as mock_transport,
+            DysonClient() as client,
+        ):
+            assert client.limits is None
+            assert "limits" not in mock_transport.call_args.kwargs
+
+    def test_client_retries_failed_connections(self) -> None:
+        """Test the HTTP transport retries failed connection attempts."""
+        with (
+            patch("libdyson_rest.client.httpx.HTTPTransport") as mock_transport,
+            DysonClient(),
+        ):
+            assert mock_transport.call_args.kwargs["retries"] == CONNECT_RETRIES
+
+    def test_client_uses_environment_proxy(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test HTTPS_PROXY from the environment is still honoured."""
+        for var in ("NO_PROXY", "no_proxy", "https_proxy", "ALL_PROXY", "all_proxy"):
+            monkeypatch.delenv(var, raising=False)
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:8080")
+
+        with (
+            patch("libdyson_rest.client.httpx.HTTPTransport") as mock_transport,
+            DysonClient(),
+        ):
+            proxy = mock_transport.call_args.kwargs["proxy"]
+            assert proxy.url == httpx.URL("http://proxy.example:8080")
+
+    def test_client_without_environment_proxy(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test no proxy is configured when the environment sets none."""
+        for var in ("HTTPS_PROXY", "https_proxy", "ALL_PROXY", "all_proxy"):
+            monkeypatch.delenv(var, raising=False)
+
+        with (
+            patch("libdyson_rest.client.httpx.HTTPTransport") as mock_transport,
+            DysonClient(),
+        ):
+            assert "proxy" not in mock_transport.call_args.kwargs
+
     def test_context_manager(self) -> None:
         """Test client works as context manager."""
         with DysonClient(email="test@example.com") as client:
@@ -313,6 +368,16 @@ class TestDysonClient:
         # After exiting context, client should be closed
         # (In real implementation, session would be closed)
 
+    def test_context_manager_closes_session_on_error(self) -> None:
+        """Test the session is closed when the with-block raises."""
+        with (
+            pytest.raises(RuntimeError),
+            DysonClient(email="test@example.com") as client,
+        ):
+            raise RuntimeError("boom")
+
+        assert client.session.is_closed
+
     @patch("libdyson_rest.client.httpx.Client.get")
     def test_get_pending_release_success(self, mock_get: Mock) -> None:
         """Test successful pending release retrieval."""
@@ -1,9 +1,12 @@
 """Tests for libdyson-rest utility functions."""
 
+import pytest
+
 from libdyson_rest.utils import (
     decode_base64,
     encode_base64,
     get_api_hostname,
+    get_environment_proxy,
     hash_password,
     safe_json_loads,
     validate_email,
@@ -120,3 +123,44 @@ def test_get_api_hostname_deterministic() -> None:
         result1 = get_api_hostname(country)
         result2 = get_api_hostname(country)
         assert result1 == result2, f"Function not deterministic for {country}"
+
+
+@pytest.fixture
+def clean_proxy_env(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    """Remove any proxy settings inherited from the test environment."""
+    for scheme in ("http", "https", "all", "no"):
+        monkeypatch.delenv(f"{scheme}_proxy", raising=False)
+        monkeypatch.delenv(f"{scheme.upper()}_PROXY", raising=False)
+    return monkeypatch
+
+
+def test_get_environment_proxy_unset(clean_proxy_env: pytest.MonkeyPatch) -> None:
+    """Test no proxy is returned when none is configured."""
+    assert get_environment_proxy("https://appapi.cp.dyson.com") is None
+
+
+def test_get_environment_proxy_https(clean_proxy_env: pytest.MonkeyPatch) -> None:
+    """Test HTTPS_PROXY is used for https URLs, and bare hosts get http://."""
+    clean_proxy_env.setenv("HTTPS_PROXY", "proxy.example:8080")
+    assert (
+        get_environment_proxy("https://appapi.cp.dyson.com")
+        == "http://proxy.example:8080"
+    )
+
+
+def test_get_environment_proxy_all_fallback(
+    clean_proxy_env: pytest.MonkeyPatch,
+) -> None:
+    """Test ALL_PROXY is used when no scheme-specific proxy is set."""
+    clean_proxy_env.setenv("ALL_PROXY", "socks5://proxy.example:1080")
+    assert (
+        get_environment_proxy("https://appapi.cp.dyson.cn")
+        == "socks5://proxy.example:1080"
+    )
+
+
+def test_get_environment_proxy_no_proxy(clean_proxy_env: pytest.MonkeyPatch) -> None:
+    """Test hosts listed in NO_PROXY bypass the proxy."""
+    clean_proxy_env.setenv("HTTPS_PROXY", "http://proxy.example:8080")
+    clean_proxy_env.setenv("NO_PROXY", "dyson.com")
+    assert get_environment_proxy("https://appapi.cp.dyson.com") is None